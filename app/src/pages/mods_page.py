@@ -2,12 +2,24 @@
 import flet as ft
 import sys
 import os
+import threading
+from collections import OrderedDict
+from datetime import datetime
 
 # 添加src目录到Python路径
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from services.theme_manager import get_theme_colors, create_card
 from services.mod_manager import mod_manager
+from services.config_manager import config_manager
+from services.mod_collection_manager import collection_manager
+from services.search_pipeline import DebouncedSearch
+from services.remote_mod_details import remote_mod_details
+
+# 当前模组页面注册的监听器（页面重建时替换，避免监听器累积）
+_size_listener = None
+_change_listener = None
+_remote_listener = None
 
 
 def heading(text, level=1, color=None):
@@ -195,180 +207,461 @@ def scrollable_page(
     return scrollable_column
 
 
-def _create_mod_card(mod_info: dict, page: ft.Page) -> ft.Control:
-    """创建单个模组卡片"""
-    colors = get_theme_colors()
+class _ModCard:
+    """
+    可复用的模组卡片
+    
+    保留卡片中会变化的控件的引用。同一模组再次显示时只修改发生变化的字段
+    （名称、大小、描述、启用状态等），不重新创建整棵控件树。
+    """
+    
+    def __init__(self, mod_info: dict, page: ft.Page, on_select=None):
+        """
+        Args:
+            mod_info (dict): 模组信息
+            page (ft.Page): 页面对象
+            on_select (callable, optional): 勾选状态变化时调用，参数为 (模组ID, 是否选中)
+        """
+        self.page = page
+        self.mod_id = mod_info['id']
+        self._on_select = on_select
+        self.colors = get_theme_colors()
+        self._shown_fields = {}
+        
+        # 模组标题（优先使用display_name，其次是name）
+        self.title = heading("", level=4)
+        
+        # 模组信息
+        id_text = body(f"ID: {self.mod_id}")
+        self.size_text = body("")
+        
+        # 创意工坊上的标题和更新时间（批量获取后填充）
+        self.remote_text = caption("")
+        self.remote_text.max_lines = 1
+        self.remote_text.overflow = ft.TextOverflow.ELLIPSIS
+        self.remote_text.expand = True
+        self.remote_text.visible = False
+        id_row = ft.Row(
+            controls=[id_text, self.remote_text],
+            spacing=10,
+        )
+        
+        # 模组描述
+        self.description_text = caption("")
+        
+        # 状态信息
+        self.is_enabled = None
+        self.status_text = caption("", size=20)
+        
+        # 显示名称与其他模组相同时，游戏中会共用同一个启用状态
+        self.collision_text = caption("", color=self.colors["error"])
+        self.collision_text.visible = False
+        status_row = ft.Row(
+            controls=[self.status_text, self.collision_text],
+            spacing=10,
+        )
+        
+        # 左侧图片部分
+        self.image_container = ft.Container(
+            width=100,
+            height=100,
+            alignment=ft.alignment.center,
+        )
+        
+        # 右侧详细信息部分
+        # 为描述文本创建可滚动容器
+        description_container = ft.Container(
+            content=ft.Column(
+                controls=[self.description_text],
+                spacing=4,
+                scroll=ft.ScrollMode.AUTO,
+                expand=True,
+            ),
+            height=40,  # 固定描述区域高度
+            expand=True,
+        )
+        
+        details_column = ft.Column(
+            controls=[
+                self.title,
+                id_row,
+                self.size_text,
+                description_container,
+                status_row
+            ],
+            spacing=4,
+            expand=True,
+        )
+        
+        # 启用/禁用按钮
+        self.toggle_button = ft.ElevatedButton(
+            "",
+            width=100,
+            height=30,
+            on_click=self.toggle_mod
+        )
+        
+        # 删除按钮（暂不实现）
+        delete_button = secondary_button("删除", width=100, height=30)
+        
+        # 批量操作的勾选框
+        self.select_checkbox = ft.Checkbox(
+            label="选择",
+            value=False,
+            on_change=self._on_select_change
+        )
+        
+        # 按钮行
+        buttons_row = ft.Row(
+            controls=[
+                self.select_checkbox,
+                self.toggle_button,
+                delete_button
+            ],
+            spacing=5,
+            alignment=ft.MainAxisAlignment.END,
+        )
+        
+        # 组合左右两部分
+        content_row = ft.Row(
+            controls=[
+                self.image_container,
+                ft.Column(
+                    controls=[
+                        details_column,
+                        buttons_row
+                    ],
+                    spacing=10,
+                    expand=True,
+                )
+            ],
+            spacing=10,
+            expand=True,
+        )
+        
+        # 创建卡片
+        self.control = create_card(content_row, padding=10, margin=5)
+        
+        self.update(mod_info)
     
-    # 检查模组是否已启用
-    is_enabled = mod_manager.is_mod_enabled(mod_info['id'])
-    print(f"模组 {mod_info['id']} 启用状态: {is_enabled}")
+    def update(self, mod_info: dict) -> bool:
+        """
+        用最新的模组信息修补卡片，只修改发生变化的字段
+        
+        Args:
+            mod_info (dict): 模组信息
+            
+        Returns:
+            bool: 卡片内容有变化返回True
+        """
+        self.mod_info = mod_info
+        mod_name = mod_info.get('display_name', mod_info.get('name', f'模组 {self.mod_id}'))
+        fields = {
+            'name': mod_name,
+            'size': mod_info.get('size', '未知'),
+            'description': mod_info.get('description', '暂无描述'),
+            'path': mod_info['path'],
+            'shared_ids': tuple(mod_manager.get_mods_sharing_name(self.mod_id)),
+            'remote': self._remote_summary(remote_mod_details.get(self.mod_id)),
+        }
+        changed = False
+        
+        if fields['name'] != self._shown_fields.get('name'):
+            self.title.value = fields['name']
+            changed = True
+        if fields['size'] != self._shown_fields.get('size'):
+            self.size_text.value = f"大小: {fields['size']}"
+            changed = True
+        if fields['description'] != self._shown_fields.get('description'):
+            self.description_text.value = fields['description']
+            changed = True
+        if fields['path'] != self._shown_fields.get('path'):
+            self.image_container.content = self._create_preview(fields['path'])
+            changed = True
+        if fields['shared_ids'] != self._shown_fields.get('shared_ids'):
+            self.collision_text.value = f"与模组 {', '.join(fields['shared_ids'])} 同名，启用状态共用"
+            self.collision_text.visible = bool(fields['shared_ids'])
+            changed = True
+        if fields['remote'] != self._shown_fields.get('remote'):
+            self._show_remote(fields['remote'])
+            changed = True
+        self._shown_fields = fields
+        
+        # 检查模组是否已启用
+        changed = self.set_enabled(mod_manager.is_mod_enabled(self.mod_id)) or changed
+        return changed
     
-    # 模组标题（优先使用display_name，其次是name）
-    mod_name = mod_info.get('display_name', mod_info.get('name', f'模组 {mod_info["id"]}'))
-    title = heading(mod_name, level=4)
+    def _create_preview(self, mod_path: str) -> ft.Control:
+        """查找预览图，没有preview.png时使用占位符图标"""
+        preview_path = os.path.join(mod_path, 'preview.png')
+        if os.path.exists(preview_path):
+            return ft.Image(
+                src=preview_path,
+                width=100,
+                height=100,
+                fit=ft.ImageFit.CONTAIN,
+            )
+        return ft.Icon(ft.Icons.FOLDER, size=60, color=self.colors["text_secondary"])
     
-    # 模组信息
-    id_text = body(f"ID: {mod_info['id']}")
-    size_text = body(f"大小: {mod_info.get('size', '未知')}")
+    @staticmethod
+    def _remote_summary(details) -> tuple:
+        """从创意工坊详情中取出卡片显示的字段"""
+        if not details:
+            return ()
+        return (details.get('title', ''), details.get('time_updated', 0))
     
-    # 模组描述
-    description_text = caption(mod_info.get('description', '暂无描述'))
+    def _show_remote(self, summary: tuple):
+        """更新创意工坊标题和更新时间文本"""
+        if not summary:
+            self.remote_text.visible = False
+            return
+        title, time_updated = summary
+        parts = []
+        if title:
+            parts.append(f"创意工坊: {title}")
+        if time_updated:
+            parts.append(f"更新于 {datetime.fromtimestamp(time_updated).strftime('%Y-%m-%d %H:%M')}")
+        self.remote_text.value = " · ".join(parts)
+        self.remote_text.tooltip = title or None
+        self.remote_text.visible = bool(parts)
     
-    # 状态信息
-    status_color = colors["primary"] if is_enabled else colors["error"]
-    status_text = caption("已启用" if is_enabled else "已禁用", color=status_color, size=20)
+    def set_remote(self, details) -> bool:
+        """
+        更新创意工坊详情
+        
+        Returns:
+            bool: 显示内容有变化返回True
+        """
+        summary = self._remote_summary(details)
+        if summary == self._shown_fields.get('remote'):
+            return False
+        self._shown_fields['remote'] = summary
+        self._show_remote(summary)
+        return True
     
-    # 查找预览图
-    preview_image = None
-    preview_path = os.path.join(mod_info['path'], 'preview.png')
-    if os.path.exists(preview_path):
-        preview_image = ft.Image(
-            src=preview_path,
-            width=100,
-            height=100,
-            fit=ft.ImageFit.CONTAIN,
+    def set_size(self, size: str):
+        """更新大小文本"""
+        self._shown_fields['size'] = size
+        self.size_text.value = f"大小: {size}"
+    
+    def set_enabled(self, is_enabled: bool) -> bool:
+        """
+        更新启用状态文本和按钮
+        
+        Returns:
+            bool: 状态有变化返回True
+        """
+        if is_enabled == self.is_enabled:
+            return False
+        self.is_enabled = is_enabled
+        self.status_text.value = "已启用" if is_enabled else "已禁用"
+        self.status_text.color = self.colors["primary"] if is_enabled else self.colors["error"]
+        self.toggle_button.text = "禁用" if is_enabled else "启用"
+        self.toggle_button.style = ft.ButtonStyle(
+            color=ft.Colors.WHITE,
+            bgcolor=self.colors["error"] if is_enabled else self.colors["primary"],
+            text_style=ft.TextStyle(font_family="MiSans")
         )
-    else:
-        # 如果没有preview.png，使用占位符图标
-        preview_image = ft.Icon(ft.Icons.FOLDER, size=60, color=colors["text_secondary"])
-    
-    # 左侧图片部分
-    image_container = ft.Container(
-        content=preview_image,
-        width=100,
-        height=100,
-        alignment=ft.alignment.center,
-    )
+        return True
     
-    # 右侧详细信息部分
-    # 为描述文本创建可滚动容器
-    description_container = ft.Container(
-        content=ft.Column(
-            controls=[description_text],
-            spacing=4,
-            scroll=ft.ScrollMode.AUTO,
-            expand=True,
-        ),
-        height=40,  # 固定描述区域高度
-        expand=True,
-    )
+    def set_selected(self, selected: bool):
+        """更新勾选框状态"""
+        self.select_checkbox.value = selected
     
-    details_column = ft.Column(
-        controls=[
-            title,
-            id_text,
-            size_text,
-            description_container,
-            status_text
-        ],
-        spacing=4,
-        expand=True,
-    )
+    def _on_select_change(self, e):
+        """勾选框点击事件"""
+        if self._on_select is not None:
+            self._on_select(self.mod_id, bool(e.control.value))
     
-    # 启用/禁用按钮
-    def toggle_mod(e):
-        # 重新检查模组状态（避免状态不同步）
-        current_enabled = mod_manager.is_mod_enabled(mod_info['id'])
-        print(f"切换模组 {mod_info['id']} 状态，当前状态: {current_enabled}")
-        if current_enabled:
-            # 禁用模组
-            print(f"尝试禁用模组 {mod_info['id']}")
-            if mod_manager.disable_mod(mod_info['id']):
-                # 更新UI
-                print("禁用成功，更新UI")
-                status_text.value = "已禁用"
-                status_text.color = colors["error"]
-                toggle_button.text = "启用"
-                toggle_button.style = ft.ButtonStyle(
-                    color=ft.Colors.WHITE,
-                    bgcolor=colors["primary"],
-                    text_style=ft.TextStyle(font_family="MiSans")
-                )
-                page.snack_bar = ft.SnackBar(
-                    content=ft.Text(f"模组 {mod_name} 已禁用"),
-                    bgcolor=ft.Colors.GREEN,
-                )
-            else:
-                page.snack_bar = ft.SnackBar(
-                    content=ft.Text(f"禁用模组 {mod_name} 失败"),
-                    bgcolor=ft.Colors.RED,
-                )
+    def toggle_mod(self, e):
+        """启用/禁用按钮点击事件：先更新界面，再交给后台写入器写回Global.json"""
+        enabled = not self.is_enabled
+        print(f"切换模组 {self.mod_id} 状态: {'启用' if enabled else '禁用'}")
+        self.set_enabled(enabled)
+        self.page.update()
+        mod_manager.set_mod_enabled_async(self.mod_id, enabled, self._on_toggle_written)
+    
+    def _on_toggle_written(self, mod_id: str, enabled: bool, success: bool):
+        """后台写入完成后的回调，写入失败时按文件中的实际状态回滚卡片"""
+        page = self.page
+        mod_name = self._shown_fields['name']
+        action = "启用" if enabled else "禁用"
+        if success:
+            self.set_enabled(enabled)
+            page.snack_bar = ft.SnackBar(
+                content=ft.Text(f"模组 {mod_name} 已{action}"),
+                bgcolor=ft.Colors.GREEN,
+            )
         else:
-            # 启用模组
-            print(f"尝试启用模组 {mod_info['id']}")
-            if mod_manager.enable_mod(mod_info['id']):
-                # 更新UI
-                print("启用成功，更新UI")
-                status_text.value = "已启用"
-                status_text.color = colors["primary"]
-                toggle_button.text = "禁用"
-                toggle_button.style = ft.ButtonStyle(
-                    color=ft.Colors.WHITE,
-                    bgcolor=colors["error"],
-                    text_style=ft.TextStyle(font_family="MiSans")
-                )
-                page.snack_bar = ft.SnackBar(
-                    content=ft.Text(f"模组 {mod_name} 已启用"),
-                    bgcolor=ft.Colors.GREEN,
-                )
-            else:
-                page.snack_bar = ft.SnackBar(
-                    content=ft.Text(f"启用模组 {mod_name} 失败"),
-                    bgcolor=ft.Colors.RED,
-                )
+            self.set_enabled(mod_manager.is_mod_enabled(mod_id))
+            page.snack_bar = ft.SnackBar(
+                content=ft.Text(f"{action}模组 {mod_name} 失败"),
+                bgcolor=ft.Colors.RED,
+            )
         
         page.snack_bar.open = True
         page.update()
+
+
+class _ModCardPool:
+    """
+    按模组ID缓存卡片
     
-    toggle_button = ft.ElevatedButton(
-        "禁用" if is_enabled else "启用",
-        width=100,
-        height=30,
-        style=ft.ButtonStyle(
-            color=ft.Colors.WHITE,
-            bgcolor=colors["error"] if is_enabled else colors["primary"],
-            text_style=ft.TextStyle(font_family="MiSans")
-        ),
-        on_click=toggle_mod
-    )
+    翻页、搜索或刷新时复用已创建的卡片控件，只修补变化的字段。
+    最近使用的卡片保留在池中，超过容量时淘汰最久未显示的卡片。
+    后台预取线程也会向池中放入卡片，因此所有访问都需要加锁。
+    """
     
-    # 删除按钮（暂不实现）
-    delete_button = secondary_button("删除", width=100, height=30)
+    def __init__(self, page: ft.Page, selection: set = None, on_select=None, capacity: int = 64):
+        """
+        Args:
+            page (ft.Page): 页面对象
+            selection (set, optional): 已选中的模组ID，卡片的勾选框据此显示
+            on_select (callable, optional): 卡片勾选状态变化时调用，参数为 (模组ID, 是否选中)
+            capacity (int): 最多缓存的卡片数量
+        """
+        self.page = page
+        self.selection = selection if selection is not None else set()
+        self.on_select = on_select
+        self.capacity = capacity
+        self._cards: "OrderedDict[str, _ModCard]" = OrderedDict()
+        self._lock = threading.Lock()
     
-    # 操作按钮
-    actions = [
-        toggle_button,
-        delete_button
-    ]
+    def get(self, mod_id: str):
+        """获取已缓存的卡片，不存在时返回None"""
+        with self._lock:
+            return self._cards.get(mod_id)
     
-    # 按钮行
-    buttons_row = ft.Row(
-        controls=actions,
-        spacing=5,
-        alignment=ft.MainAxisAlignment.END,
-    )
+    def acquire(self, mod_info: dict) -> _ModCard:
+        """
+        获取模组卡片，已缓存时修补字段后复用，否则新建
+        
+        Args:
+            mod_info (dict): 模组信息
+            
+        Returns:
+            _ModCard: 模组卡片
+        """
+        mod_id = mod_info['id']
+        with self._lock:
+            card = self._cards.get(mod_id)
+            if card is None:
+                card = _ModCard(mod_info, self.page, self.on_select)
+                # 固定卡片尺寸
+                card.control.width = 500
+                card.control.height = 250
+                self._cards[mod_id] = card
+            else:
+                card.update(mod_info)
+                self._cards.move_to_end(mod_id)
+            card.set_selected(mod_id in self.selection)
+            
+            while len(self._cards) > self.capacity:
+                self._cards.popitem(last=False)
+            return card
     
-    # 组合左右两部分
-    content_row = ft.Row(
-        controls=[
-            image_container,
-            ft.Column(
-                controls=[
-                    details_column,
-                    buttons_row
-                ],
-                spacing=10,
-                expand=True,
-            )
-        ],
-        spacing=10,
-        expand=True,
-    )
+    def cards(self) -> list:
+        """获取当前缓存的全部卡片"""
+        with self._lock:
+            return list(self._cards.values())
+    
+    def clear(self):
+        """清空全部卡片"""
+        with self._lock:
+            self._cards.clear()
+
+
+class _VirtualModList:
+    """
+    虚拟化的模组列表（滚动浏览模式）
+    
+    每行两张固定高度的卡片，只为可见区域及上下少量缓冲行创建控件，
+    其余行用上下两个占位容器撑开滚动高度。滚动时按滚动位置重新计算可见行，
+    移出窗口的卡片控件交还卡片池，模组再多也只保留几十个卡片控件。
+    """
+    
+    # 卡片高度250，加上行间距
+    ROW_HEIGHT = 260
+    COLUMNS = 2
+    
+    def __init__(self, page: ft.Page, card_pool: _ModCardPool, height: int = 780, buffer_rows: int = 2):
+        """
+        Args:
+            page (ft.Page): 页面对象
+            card_pool (_ModCardPool): 卡片池
+            height (int): 列表可见高度
+            buffer_rows (int): 可见区域上下各额外保留的行数
+        """
+        self.page = page
+        self.card_pool = card_pool
+        self.height = height
+        self.buffer_rows = buffer_rows
+        self.mods = []
+        self._offset = 0.0
+        # 当前已创建控件的行范围 [start, end)
+        self._window = None
+        
+        self.top_spacer = ft.Container(height=0)
+        self.bottom_spacer = ft.Container(height=0)
+        self.rows_column = ft.Column(spacing=0)
+        self.control = ft.ListView(
+            controls=[self.top_spacer, self.rows_column, self.bottom_spacer],
+            height=height,
+            spacing=0,
+            on_scroll=self._on_scroll,
+            on_scroll_interval=50,
+        )
+    
+    def set_mods(self, mods: list, reset_scroll: bool = True):
+        """
+        设置要显示的模组列表
+        
+        Args:
+            mods (list): 模组信息列表
+            reset_scroll (bool): 是否回到列表顶部
+        """
+        self.mods = mods
+        self._window = None
+        if reset_scroll:
+            self._offset = 0.0
+            if self.control.page is not None:
+                self.control.scroll_to(offset=0, duration=0)
+        self._render()
     
-    # 创建卡片
-    card = create_card(content_row, padding=10, margin=5)
+    def _on_scroll(self, e):
+        """滚动时更新可见窗口，窗口没有变化时不发送更新"""
+        self._offset = e.pixels
+        if self._render():
+            self.page.update()
     
-    return card
+    def _render(self) -> bool:
+        """
+        按滚动位置重建可见行
+        
+        Returns:
+            bool: 可见窗口有变化返回True
+        """
+        total_rows = (len(self.mods) + self.COLUMNS - 1) // self.COLUMNS
+        first_visible = int(self._offset // self.ROW_HEIGHT)
+        visible_rows = self.height // self.ROW_HEIGHT + 1
+        start = max(0, first_visible - self.buffer_rows)
+        end = min(total_rows, first_visible + visible_rows + self.buffer_rows)
+        if (start, end) == self._window:
+            return False
+        self._window = (start, end)
+        
+        rows = []
+        for row in range(start, end):
+            row_mods = self.mods[row * self.COLUMNS:(row + 1) * self.COLUMNS]
+            rows.append(ft.Row(
+                controls=[self.card_pool.acquire(mod_info).control for mod_info in row_mods],
+                height=self.ROW_HEIGHT,
+                spacing=10,
+            ))
+        self.rows_column.controls = rows
+        self.top_spacer.height = start * self.ROW_HEIGHT
+        self.bottom_spacer.height = (total_rows - end) * self.ROW_HEIGHT
+        return True
 
 
 def mods_page_view(page: ft.Page):
@@ -383,6 +676,18 @@ def mods_page_view(page: ft.Page):
     # 创建一个引用，用于更新模组列表
     mod_cards_container = ft.Column(spacing=10)
     
+    # 双列布局只创建一次，之后翻页只替换两列中的卡片
+    left_column = ft.Column(spacing=10, expand=True)
+    right_column = ft.Column(spacing=10, expand=True)
+    mod_cards_container.controls.append(ft.ResponsiveRow(
+        controls=[
+            ft.Container(content=left_column, col={"xs": 12, "sm": 12, "md": 6}),
+            ft.Container(content=right_column, col={"xs": 12, "sm": 12, "md": 6}),
+        ],
+        spacing=10,
+        expand=True
+    ))
+    
     # 创建带动画效果的模组列表容器
     mod_list_container = ft.Container(
         content=mod_cards_container,
@@ -395,9 +700,216 @@ def mods_page_view(page: ft.Page):
     page_info_text_top = caption(f"第 {current_page} 页，共 {total_pages} 页")  # 顶部页面信息
     count_text = caption("总共 0 个模组")
     
-    def refresh_mods_list(search_term="", page_num=1):
+    # 批量操作选中的模组ID
+    selected_ids = set()
+    selection_text = caption("已选择 0 个模组")
+    
+    def on_mod_selected(mod_id, selected):
+        """卡片勾选状态变化"""
+        if selected:
+            selected_ids.add(mod_id)
+        else:
+            selected_ids.discard(mod_id)
+        selection_text.value = f"已选择 {len(selected_ids)} 个模组"
+        page.update()
+    
+    # 按模组ID复用的卡片控件
+    card_pool = _ModCardPool(page, selected_ids, on_mod_selected)
+    
+    # 滚动浏览模式：虚拟化列表代替固定16个一页的分页
+    scroll_mode = config_manager.get("mods_view_mode", "pages") == "scroll"
+    virtual_list = _VirtualModList(page, card_pool)
+    
+    def on_mod_size_computed(mod_id, size, size_bytes):
+        """后台计算出模组大小后更新对应卡片"""
+        card = card_pool.get(mod_id)
+        if card is None:
+            return
+        card.set_size(size)
+        page.update()
+    
+    def on_mods_changed():
+        """目录监视器更新模组列表后刷新当前页"""
+        cancel_prefetch()
+        refresh_mods_list(search_box_top.value, current_page)
+        # 新下载的模组还没有创意工坊详情
+        page.run_thread(remote_mod_details.refresh_local_mods)
+    
+    def on_remote_details_updated(mod_ids):
+        """批量获取到创意工坊详情后更新已创建的卡片"""
+        changed = False
+        for mod_id in mod_ids:
+            card = card_pool.get(mod_id)
+            if card is not None:
+                changed = card.set_remote(remote_mod_details.get(mod_id)) or changed
+        if changed:
+            page.update()
+    
+    global _size_listener, _change_listener, _remote_listener
+    if _size_listener is not None:
+        mod_manager.remove_size_listener(_size_listener)
+    _size_listener = on_mod_size_computed
+    mod_manager.add_size_listener(_size_listener)
+    if _change_listener is not None:
+        mod_manager.remove_change_listener(_change_listener)
+    _change_listener = on_mods_changed
+    mod_manager.add_change_listener(_change_listener)
+    if _remote_listener is not None:
+        remote_mod_details.remove_listener(_remote_listener)
+    _remote_listener = on_remote_details_updated
+    remote_mod_details.add_listener(_remote_listener)
+    
+    # 上次渲染时的 (缓存代数, 页码, 搜索词)，内容没有变化时跳过重新渲染
+    # 排序和筛选选项变化时直接清空，不计入此键
+    rendered_key = None
+    
+    def query_options():
+        """获取当前的排序和筛选选项"""
+        options = {
+            "sort_by": sort_dropdown.value,
+            "descending": bool(descending_checkbox.value),
+            "filter_by": filter_dropdown.value,
+        }
+        if filter_dropdown.value in ("in_collection", "not_in_collection"):
+            options["collection_mod_ids"] = collection_manager.get_collected_mod_ids()
+        return options
+    
+    def has_default_options():
+        """是否使用默认的目录顺序且不筛选"""
+        return sort_dropdown.value == "default" and not descending_checkbox.value and filter_dropdown.value == "all"
+    
+    # 后台预取的相邻页：(缓存代数, 页码, 搜索词) -> 该页的模组列表
+    prefetched_pages = {}
+    # 搜索或刷新时递增，正在进行的预取发现令牌变化后立即放弃
+    prefetch_token = 0
+    
+    def cancel_prefetch():
+        """取消正在进行的预取并丢弃已预取的页面"""
+        nonlocal prefetch_token
+        prefetch_token += 1
+        prefetched_pages.clear()
+    
+    # 边扫描边渲染时使用的令牌，搜索、刷新或选项变化时递增，旧的加载循环不再修改页面
+    load_token = 0
+    
+    def cancel_loading():
+        """让正在进行的边扫描边渲染停止更新页面（扫描本身继续完成并写入缓存）"""
+        nonlocal load_token
+        load_token += 1
+    
+    def prefetch_neighbors(token, search_term, page_num, pages, options):
+        """在后台准备前后两页的模组数据和卡片控件"""
+        generation = mod_manager.get_cache_generation()
+        for neighbor in (page_num + 1, page_num - 1):
+            if neighbor < 1 or neighbor > pages:
+                continue
+            key = (generation, neighbor, search_term)
+            if key in prefetched_pages:
+                continue
+            page_mods, _ = mod_manager.get_downloaded_mods_paginated(neighbor, 16, search_term, **options)
+            for mod_info in page_mods:
+                if token != prefetch_token:
+                    return
+                card_pool.acquire(mod_info)
+            if token != prefetch_token:
+                return
+            prefetched_pages[key] = page_mods
+            # 只保留最近预取的几页
+            while len(prefetched_pages) > 4:
+                prefetched_pages.pop(next(iter(prefetched_pages)))
+    
+    def schedule_prefetch(search_term, page_num):
+        """渲染完成后启动相邻页预取"""
+        threading.Thread(
+            target=prefetch_neighbors,
+            args=(prefetch_token, search_term or "", page_num, total_pages, query_options()),
+            daemon=True
+        ).start()
+    
+    def create_no_mods_content():
+        """创建没有模组时的提示信息"""
+        return ft.Column([
+            ft.Icon(ft.Icons.FOLDER_OFF, size=64, color=colors["text_secondary"]),
+            heading("未找到已下载的模组", level=3),
+            body("请先在创意工坊页面下载模组，或在设置页面设置正确的游戏路径"),
+        ], horizontal_alignment=ft.CrossAxisAlignment.CENTER, spacing=20)
+    
+    def update_page_info(mod_count):
+        """更新页码和总计信息"""
+        page_info_text.value = f"第 {current_page} 页，共 {total_pages} 页"
+        page_info_text_top.value = f"第 {current_page} 页，共 {total_pages} 页"
+        count_text.value = f"总共 {mod_count} 个模组"
+    
+    def load_mods_progressively(page_num=1):
+        """模组列表尚未缓存时边扫描边渲染，当前页的模组每解析出一个就立即显示"""
+        nonlocal current_page, total_pages, rendered_key
+        
+        cancel_loading()
+        token = load_token
+        left_column.controls = []
+        right_column.controls = []
+        current_page = page_num
+        
+        start_index = (page_num - 1) * 16
+        end_index = start_index + 16
+        mod_count = 0
+        for mod_info in mod_manager.iter_downloaded_mods():
+            if token != load_token:
+                # 已被搜索、刷新或翻页取代，继续遍历让扫描完成并写入缓存，但不再修改页面
+                continue
+            if start_index <= mod_count < end_index:
+                # 交替将模组卡片添加到左右两列
+                card = card_pool.acquire(mod_info)
+                if (mod_count - start_index) % 2 == 0:
+                    left_column.controls.append(card.control)
+                else:
+                    right_column.controls.append(card.control)
+                page.update()
+            mod_count += 1
+        
+        if token != load_token:
+            return
+        if mod_count == 0:
+            left_column.controls.append(create_no_mods_content())
+        elif mod_manager.get_name_collisions():
+            # 扫描完成后才能确定全部显示名称冲突，修补先显示出来的卡片的冲突提示
+            changed = False
+            for card in card_pool.cards():
+                changed = card.update(card.mod_info) or changed
+            if changed:
+                page.update()
+        
+        total_pages = (mod_count + 15) // 16  # 向上取整
+        rendered_key = (mod_manager.get_cache_generation(), page_num, "")
+        update_page_info(mod_count)
+        update_pagination_buttons()
+        schedule_prefetch("", page_num)
+    
+    def refresh_mods_list(search_term="", page_num=1, force=False):
         """刷新模组列表（分页版本）"""
-        nonlocal current_page, total_pages
+        nonlocal rendered_key
+        
+        if scroll_mode:
+            load_scroll_list(search_term, force)
+            return
+        
+        # 首次加载、没有搜索词且使用默认排序筛选时边扫描边渲染
+        if not search_term and not mod_manager.has_cached_mods() and has_default_options():
+            load_mods_progressively(page_num)
+            return
+        
+        # 确保模组列表已扫描，再根据缓存代数判断是否需要重新渲染
+        mod_manager.get_downloaded_mods()
+        render_key = (mod_manager.get_cache_generation(), page_num, search_term or "")
+        if not force and render_key == rendered_key:
+            return
+        rendered_key = render_key
+        
+        # 已预取的页面直接显示，不再等待淡出动画
+        prefetched = prefetched_pages.get(render_key)
+        if prefetched is not None:
+            render_mods_page(prefetched, page_num, total_pages, search_term)
+            return
         
         # 执行淡出动画
         mod_list_container.opacity = 0
@@ -407,78 +919,97 @@ def mods_page_view(page: ft.Page):
         import time
         time.sleep(0.25)  # 等待250ms动画完成
         
-        # 清空现有内容
-        mod_cards_container.controls.clear()
+        # 获取已下载的模组（先在全部模组中搜索，再分页）
+        page_mods, pages = mod_manager.get_downloaded_mods_paginated(page_num, 16, search_term or "", **query_options())
+        render_mods_page(page_mods, page_num, pages, search_term)
         
-        # 获取已下载的模组（分页）
-        page_mods, total_pages = mod_manager.get_downloaded_mods_paginated(page_num, 16)
-        current_page = page_num
+        # 淡入动画
+        mod_list_container.opacity = 1
+        page.update()
+    
+    def load_scroll_list(search_term="", force=False):
+        """滚动浏览模式下加载模组列表"""
+        nonlocal rendered_key
         
-        # 如果有搜索词，进行过滤
-        if search_term:
-            filtered_mods = []
-            for mod_info in page_mods:
-                # 获取模组名称和描述
-                mod_name = mod_info.get('display_name', mod_info.get('name', f'模组 {mod_info["id"]}'))
-                mod_description = mod_info.get('description', '')
-                
-                # 检查搜索词是否在名称或描述中
-                if search_term.lower() in mod_name.lower() or search_term.lower() in mod_description.lower():
-                    filtered_mods.append(mod_info)
-            page_mods = filtered_mods
-            # 重新计算总页数
-            total_pages = (len(page_mods) + 15) // 16  # 向上取整
-        
-        # 创建双列布局
-        left_column = ft.Column(spacing=10, expand=True)
-        right_column = ft.Column(spacing=10, expand=True)
+        # 首次加载时每解析出一批模组就更新一次列表
+        loaded_progressively = not search_term and not mod_manager.has_cached_mods() and has_default_options()
+        if loaded_progressively:
+            cancel_loading()
+            token = load_token
+            loaded_mods = []
+            for mod_info in mod_manager.iter_downloaded_mods():
+                if token != load_token:
+                    continue
+                loaded_mods.append(mod_info)
+                if len(loaded_mods) % 16 == 0:
+                    virtual_list.set_mods(list(loaded_mods), reset_scroll=False)
+                    update_page_info(len(loaded_mods))
+                    page.update()
+            if token != load_token:
+                return
+        
+        mods = mod_manager.query_mods(search_term, **query_options())
+        render_key = (mod_manager.get_cache_generation(), "scroll", search_term or "")
+        if not force and render_key == rendered_key:
+            return
+        # 搜索词没变时（刷新或目录变化）保持滚动位置
+        reset_scroll = not loaded_progressively and (rendered_key is None or rendered_key[2] != render_key[2])
+        rendered_key = render_key
+        virtual_list.set_mods(mods, reset_scroll=reset_scroll)
+        update_page_info(len(mod_manager.get_downloaded_mods()))
+        page.update()
+    
+    def render_mods_page(page_mods, page_num, pages, search_term=""):
+        """显示给定的模组，复用卡片池中的卡片，最后统一发送一次页面更新"""
+        nonlocal current_page, total_pages
+        
+        current_page = page_num
+        total_pages = pages
         
         # 交替将模组卡片添加到左右两列
-        for i, mod_info in enumerate(page_mods):
-            mod_card = _create_mod_card(mod_info, page)
-            # 固定卡片尺寸
-            mod_card.width = 500
-            mod_card.height = 250
-            if i % 2 == 0:
-                left_column.controls.append(mod_card)
-            else:
-                right_column.controls.append(mod_card)
+        cards = [card_pool.acquire(mod_info).control for mod_info in page_mods]
+        left_controls = cards[0::2]
+        right_controls = cards[1::2]
         
         # 如果没有模组，显示提示信息
         if not page_mods:
-            no_mods_content = ft.Column([
-                ft.Icon(ft.Icons.FOLDER_OFF, size=64, color=colors["text_secondary"]),
-                heading("未找到已下载的模组", level=3),
-                body("请先在创意工坊页面下载模组，或在设置页面设置正确的游戏路径"),
-            ], horizontal_alignment=ft.CrossAxisAlignment.CENTER, spacing=20)
-            left_column.controls.append(no_mods_content)
-        
-        # 创建双列容器
-        columns_row = ft.ResponsiveRow(
-            controls=[
-                ft.Container(content=left_column, col={"xs": 12, "sm": 12, "md": 6}),
-                ft.Container(content=right_column, col={"xs": 12, "sm": 12, "md": 6}),
-            ],
-            spacing=10,
-            expand=True
-        )
+            left_controls = [create_no_mods_content()]
         
-        # 添加双列容器到主容器
-        mod_cards_container.controls.append(columns_row)
+        # 卡片顺序不变时不替换列表，只发送卡片自身被修补的字段
+        if left_controls != left_column.controls:
+            left_column.controls = left_controls
+        if right_controls != right_column.controls:
+            right_column.controls = right_controls
         
-        # 更新页面信息
-        page_info_text.value = f"第 {current_page} 页，共 {total_pages} 页"
-        page_info_text_top.value = f"第 {current_page} 页，共 {total_pages} 页"
-        # 更新总计信息
-        all_mods = mod_manager.get_downloaded_mods()
-        count_text.value = f"总共 {len(all_mods)} 个模组"
+        # 更新页面信息和总计信息
+        update_page_info(len(mod_manager.get_downloaded_mods()))
         
-        # 更新分页按钮状态
+        # 更新分页按钮状态（同时发送本次渲染的全部修改）
         update_pagination_buttons()
         
-        # 淡入动画
-        mod_list_container.opacity = 1
-        page.update()
+        schedule_prefetch(search_term, page_num)
+    
+    def on_search_result(search_term, matched_mods):
+        """防抖搜索完成后只渲染最终结果的第一页（不做淡入淡出）"""
+        nonlocal rendered_key
+        if search_term:
+            search_stats_text.value = f"找到 {len(matched_mods)} 个模组，用时 {search_pipeline.get_stats()['last_ms']:.1f} ms"
+        else:
+            search_stats_text.value = ""
+        if scroll_mode:
+            rendered_key = (mod_manager.get_cache_generation(), "scroll", search_term or "")
+            virtual_list.set_mods(matched_mods)
+            page.update()
+            return
+        rendered_key = (mod_manager.get_cache_generation(), 1, search_term or "")
+        render_mods_page(matched_mods[:16], 1, (len(matched_mods) + 15) // 16, search_term)
+    
+    # 输入停止300ms后才搜索，新输入会取消尚未完成的旧查询
+    search_pipeline = DebouncedSearch(
+        lambda search_term: mod_manager.query_mods(search_term, **query_options()),
+        on_search_result
+    )
+    search_stats_text = caption("")
     
     def update_pagination_buttons():
         """更新分页按钮状态"""
@@ -539,11 +1070,13 @@ def mods_page_view(page: ft.Page):
     def on_prev_page(e):
         """上一页按钮点击事件"""
         if current_page > 1:
+            search_pipeline.cancel()
             refresh_mods_list(search_box_top.value, current_page - 1)
     
     def on_next_page(e):
         """下一页按钮点击事件"""
         if current_page < total_pages:
+            search_pipeline.cancel()
             refresh_mods_list(search_box_top.value, current_page + 1)
     
     # 搜索框处理函数
@@ -552,7 +1085,9 @@ def mods_page_view(page: ft.Page):
         search_value = e.control.value
         search_box_top.value = search_value
         search_box_bottom.value = search_value
-        refresh_mods_list(search_value, 1)  # 搜索时回到第一页
+        cancel_prefetch()
+        cancel_loading()
+        search_pipeline.submit(search_value)  # 搜索时回到第一页
     
     # 创建搜索框（顶部和底部各一个）
     search_box_top = ft.TextField(
@@ -572,7 +1107,149 @@ def mods_page_view(page: ft.Page):
     )
     
     # 创建刷新按钮
-    refresh_button = primary_button("刷新列表", on_click=lambda _: refresh_mods_list(search_box_top.value, current_page))
+    def on_refresh_click(e):
+        """刷新按钮点击事件：重新扫描模组目录"""
+        search_pipeline.cancel()
+        cancel_prefetch()
+        cancel_loading()
+        mod_manager.invalidate_cache()
+        refresh_mods_list(search_box_top.value, current_page, force=True)
+    
+    refresh_button = primary_button("刷新列表", on_click=on_refresh_click)
+    
+    def apply_bulk_state(mod_ids, enabled):
+        """批量设置启用状态：只写一次Global.json，修补全部卡片后只发送一次页面更新"""
+        action = "启用" if enabled else "禁用"
+        if not mod_ids:
+            page.snack_bar = ft.SnackBar(content=ft.Text(f"没有可{action}的模组"))
+            page.snack_bar.open = True
+            page.update()
+            return
+        
+        results = mod_manager.set_mods_enabled({mod_id: enabled for mod_id in mod_ids})
+        success_count = sum(1 for success in results.values() if success)
+        
+        # 同名模组共用启用状态，因此按实际状态修补所有已创建的卡片
+        for card in card_pool.cards():
+            card.set_enabled(mod_manager.is_mod_enabled(card.mod_id))
+            card.set_selected(False)
+        selected_ids.clear()
+        selection_text.value = "已选择 0 个模组"
+        
+        page.snack_bar = ft.SnackBar(
+            content=ft.Text(f"已{action} {success_count}/{len(mod_ids)} 个模组"),
+            bgcolor=ft.Colors.GREEN if success_count == len(mod_ids) else ft.Colors.RED,
+        )
+        page.snack_bar.open = True
+        page.update()
+    
+    def on_enable_selected(e):
+        apply_bulk_state(sorted(selected_ids), True)
+    
+    def on_disable_selected(e):
+        apply_bulk_state(sorted(selected_ids), False)
+    
+    def listed_mod_ids():
+        """当前搜索和筛选条件下列出的全部模组ID"""
+        return [mod['id'] for mod in mod_manager.query_mods(search_box_top.value or "", **query_options())]
+    
+    def on_enable_all(e):
+        apply_bulk_state(listed_mod_ids(), True)
+    
+    def on_disable_all(e):
+        apply_bulk_state(listed_mod_ids(), False)
+    
+    def on_clear_selection(e):
+        for card in card_pool.cards():
+            card.set_selected(False)
+        selected_ids.clear()
+        selection_text.value = "已选择 0 个模组"
+        page.update()
+    
+    # 批量操作按钮（全部启用/禁用作用于当前搜索和筛选结果中的所有模组）
+    bulk_actions_row = ft.Row([
+        selection_text,
+        primary_button("启用所选", on_click=on_enable_selected),
+        secondary_button("禁用所选", on_click=on_disable_selected),
+        primary_button("全部启用", on_click=on_enable_all),
+        secondary_button("全部禁用", on_click=on_disable_all),
+        secondary_button("清除选择", on_click=on_clear_selection),
+    ], spacing=10)
+    
+    def apply_view_mode():
+        """根据浏览模式切换分页控件和虚拟列表的可见性"""
+        for control in (pagination_row_top, pagination_row_bottom, mod_list_container):
+            control.visible = not scroll_mode
+        virtual_list.control.visible = scroll_mode
+    
+    def on_view_mode_change(e):
+        """切换滚动浏览/分页模式"""
+        nonlocal scroll_mode, rendered_key
+        scroll_mode = e.control.value
+        config_manager.set("mods_view_mode", "scroll" if scroll_mode else "pages")
+        search_pipeline.cancel()
+        cancel_prefetch()
+        cancel_loading()
+        rendered_key = None
+        apply_view_mode()
+        page.update()
+        refresh_mods_list(search_box_top.value, 1)
+    
+    def on_view_options_change(e):
+        """排序或筛选变化后回到第一页（只对内存中的模组重新排序，不重新扫描）"""
+        nonlocal rendered_key
+        search_pipeline.cancel()
+        cancel_prefetch()
+        cancel_loading()
+        rendered_key = None
+        refresh_mods_list(search_box_top.value, 1)
+    
+    def create_option_dropdown(label, options, value, width):
+        """创建排序/筛选下拉框"""
+        return ft.Dropdown(
+            label=label,
+            options=[
+                ft.dropdown.Option(key, text, style=ft.TextStyle(color=colors["text_primary"]))
+                for key, text in options
+            ],
+            value=value,
+            on_change=on_view_options_change,
+            width=width,
+            border_radius=8,
+            color=colors["text_primary"],
+            bgcolor=colors["card_background"],
+            focused_bgcolor=colors["card_background"],
+            focused_color=colors["text_primary"],
+            label_style=ft.TextStyle(color=colors["text_primary"]),
+            border_color="#999999"
+        )
+    
+    sort_dropdown = create_option_dropdown("排序方式", [
+        ("default", "默认顺序"),
+        ("name", "名称"),
+        ("size", "大小"),
+        ("enabled", "启用状态"),
+    ], "default", 130)
+    
+    filter_dropdown = create_option_dropdown("筛选", [
+        ("all", "全部"),
+        ("enabled", "已启用"),
+        ("disabled", "已禁用"),
+        ("in_collection", "在合集中"),
+        ("not_in_collection", "不在合集中"),
+    ], "all", 130)
+    
+    descending_checkbox = ft.Checkbox(
+        label="倒序",
+        value=False,
+        on_change=on_view_options_change
+    )
+    
+    view_mode_checkbox = ft.Checkbox(
+        label="滚动浏览",
+        value=scroll_mode,
+        on_change=on_view_mode_change
+    )
     
     # 创建分页按钮
     prev_button = ft.ElevatedButton(
@@ -603,6 +1280,21 @@ def mods_page_view(page: ft.Page):
         disabled=(current_page >= total_pages)
     )
     
+    # 分页控件（滚动浏览模式下隐藏）
+    pagination_row_top = ft.Row([
+        prev_button_top,
+        page_info_text_top,
+        next_button_top
+    ], alignment=ft.MainAxisAlignment.CENTER, spacing=20)
+    
+    pagination_row_bottom = ft.Row([
+        prev_button,
+        page_info_text,
+        next_button
+    ], alignment=ft.MainAxisAlignment.CENTER, spacing=20)
+    
+    apply_view_mode()
+    
     # 创建页面内容
     content = [
         heading("模组管理", level=1),
@@ -614,29 +1306,32 @@ def mods_page_view(page: ft.Page):
         ft.Row([
             refresh_button,
             search_box_top,
+            view_mode_checkbox,
+            search_stats_text,
         ], spacing=10),
         
+        ft.Row([
+            sort_dropdown,
+            descending_checkbox,
+            filter_dropdown,
+        ], spacing=10),
+        
+        bulk_actions_row,
+        
         ft.Divider(height=20),
         
         # 顶部分页控件
-        ft.Row([
-            prev_button_top,
-            page_info_text_top,
-            next_button_top
-        ], alignment=ft.MainAxisAlignment.CENTER, spacing=20),
+        pagination_row_top,
         
         ft.Divider(height=20),
         
         mod_list_container,
+        virtual_list.control,
         
         ft.Divider(height=20),
         
         # 底部分页控件
-        ft.Row([
-            prev_button,
-            page_info_text,
-            next_button
-        ], alignment=ft.MainAxisAlignment.CENTER, spacing=20),
+        pagination_row_bottom,
         
         ft.Divider(height=20),
         
@@ -650,8 +1345,13 @@ def mods_page_view(page: ft.Page):
         count_text
     ]
     
-    # 首次加载时刷新模组列表
-    refresh_mods_list()
+    def initial_load():
+        """首次加载模组列表，完成后批量获取缺少或已过期的创意工坊详情"""
+        refresh_mods_list()
+        remote_mod_details.refresh_local_mods()
+    
+    # 首次加载时在后台刷新模组列表，页面先显示，卡片随扫描进度逐个出现
+    page.run_thread(initial_load)
     
     # 使用可滚动页面布局，默认左对齐
     scrollable_content = scrollable_page(
@@ -7,9 +7,10 @@ import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from services.theme_manager import get_theme_colors, create_card, add_theme_listener, remove_theme_listener
-from services.steam_workshop_service import SteamWorkshopService
+from services.async_workshop_client import async_workshop_client
 from services.mod_manager import mod_manager
 from services.config_manager import config_manager
+from services.lru_cache import workshop_preload_cache
 import asyncio
 from typing import Dict, List, Optional
 import traceback
@@ -160,16 +161,12 @@ class SteamWorkshopPage:
     
     def __init__(self, page: ft.Page):
         self.page = page
-        self.service = SteamWorkshopService()
+        # 异步数据获取引擎，连接池和并发限制由所有页面实例共用
+        self.client = async_workshop_client
         self.app_id = "3167020"  # Duckov Game的App ID
         
-        # 预加载数据存储
-        self.preloaded_data = {
-            'most_popular': {},
-            'top_rated': {},
-            'newest': {},
-            'last_updated': {}
-        }
+        # 预加载数据存储：页面与预加载线程共用的有界LRU缓存，键为 (app_id, 排序方式, 页码)
+        self.preloaded_data = workshop_preload_cache
         
         # 当前显示的数据
         self.current_data = {
@@ -191,6 +188,9 @@ class SteamWorkshopPage:
         self.scrollable_column = None  # 滚动列引用
         self.download_status = None  # 下载状态显示控件
         
+        # 本地已下载模组的ID，每次加载列表时重新获取，渲染卡片时直接查询
+        self.downloaded_mod_ids = set()
+        
         # 添加主题变化监听器
         add_theme_listener(self._on_theme_changed)
         
@@ -227,149 +227,46 @@ class SteamWorkshopPage:
         # 预加载将在页面加载后通过其他方式触发
         pass
 
-    def start_preloading(self):
-        """开始预加载数据（使用多线程IO同步预载）"""
-        import concurrent.futures
-        import threading
-        
-        def preload_single_page(sort_method, page_num):
-            """预加载单个页面"""
-            try:
-                # 使用线程安全的同步方式获取数据
-                result = self.service.get_workshop_items(
-                    self.app_id, sort_method, '', page_num
-                )
-                if result:
-                    # 使用线程锁确保数据安全
-                    with threading.Lock():
-                        if sort_method not in self.preloaded_data:
-                            self.preloaded_data[sort_method] = {}
-                        self.preloaded_data[sort_method][page_num] = result
-                    print(f"预加载完成: {sort_method} 第{page_num}页")
-                    return True
-            except Exception as e:
-                print(f"预加载失败 {sort_method} 第{page_num}页: {e}")
-            return False
-        
-        def preload_all_data():
-            """多线程预加载所有数据"""
-            sort_methods = ['most_popular', 'top_rated', 'newest', 'last_updated']
-            
-            # 使用线程池执行预加载任务
-            with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
-                # 创建所有预加载任务
-                futures = []
-                for sort_method in sort_methods:
-                    for page_num in range(1, 4):  # 预加载1-3页
-                        future = executor.submit(preload_single_page, sort_method, page_num)
-                        futures.append(future)
-                
-                # 等待所有任务完成
-                completed_count = 0
-                for future in concurrent.futures.as_completed(futures):
-                    try:
-                        result = future.result()
-                        if result:
-                            completed_count += 1
-                    except Exception as e:
-                        print(f"预加载任务异常: {e}")
-                
-                print(f"预加载完成: {completed_count}/{len(futures)} 个页面")
-        
-        # 在新线程中执行预加载，避免阻塞UI
-        preload_thread = threading.Thread(target=preload_all_data, daemon=True)
-        preload_thread.start()
-
-    async def start_preloading_async(self):
-        """异步版本的预加载启动函数"""
-        # 在执行器中运行同步的预加载函数
-        await asyncio.get_event_loop().run_in_executor(None, self._start_preloading_blocking)
-
-    def _start_preloading_blocking(self):
-        """在阻塞模式下运行预加载"""
-        self.start_preloading()
+    async def start_preloading(self):
+        """开始预加载数据（在页面事件循环中并发请求，共用一个连接池）"""
+        sort_methods = ['most_popular', 'top_rated', 'newest', 'last_updated']
+        # 预加载每种排序的1-3页
+        pages = [(sort_method, page_num) for sort_method in sort_methods for page_num in range(1, 4)]
+        try:
+            loaded = await self.client.preload(self.app_id, pages, self.preloaded_data)
+            print(f"预加载完成: 新加载 {loaded}/{len(pages)} 个页面")
+            print(f"预加载缓存: {self.preloaded_data.get_stats()}")
+        except Exception as e:
+            print(f"预加载任务异常: {e}")
 
-    def smart_preload(self, sort_by: str, current_page: int, total_pages: int):
+    async def smart_preload(self, sort_by: str, current_page: int, total_pages: int):
         """
         智能预加载后续页面数据
         当用户切换到某一页时，预加载该页后面的页面
         """
-        import concurrent.futures
-        import threading
-        
-        def preload_single_page(sort_method, page_num):
-            """预加载单个页面"""
-            try:
-                # 检查是否已经预加载过
-                if (sort_method in self.preloaded_data and 
-                    page_num in self.preloaded_data[sort_method]):
-                    return True
-                    
-                # 使用线程安全的同步方式获取数据
-                result = self.service.get_workshop_items(
-                    self.app_id, sort_method, '', page_num
-                )
-                if result:
-                    # 使用线程锁确保数据安全
-                    with threading.Lock():
-                        if sort_method not in self.preloaded_data:
-                            self.preloaded_data[sort_method] = {}
-                        self.preloaded_data[sort_method][page_num] = result
-                    print(f"智能预加载完成: {sort_method} 第{page_num}页")
-                    return True
-            except Exception as e:
-                print(f"智能预加载失败 {sort_method} 第{page_num}页: {e}")
-            return False
-        
-        def preload_next_pages():
-            """预加载后续页面"""
-            # 预加载当前页之后的页面
-            pages_to_preload = []
-            for i in range(1, 4):  # 预加载后续3页
-                next_page = current_page + i
-                if next_page <= total_pages:
-                    pages_to_preload.append(next_page)
-            
-            # 使用线程池执行预加载任务
-            with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
-                # 创建预加载任务
-                futures = []
-                for page_num in pages_to_preload:
-                    future = executor.submit(preload_single_page, sort_by, page_num)
-                    futures.append(future)
-                
-                # 等待所有任务完成
-                completed_count = 0
-                for future in concurrent.futures.as_completed(futures):
-                    try:
-                        result = future.result()
-                        if result:
-                            completed_count += 1
-                    except Exception as e:
-                        print(f"智能预加载任务异常: {e}")
-                
-                print(f"智能预加载完成: {completed_count}/{len(futures)} 个页面")
-        
-        # 在新线程中执行预加载，避免阻塞UI
-        if current_page < total_pages:  # 只有当前页不是最后一页时才预加载
-            preload_thread = threading.Thread(target=preload_next_pages, daemon=True)
-            preload_thread.start()
+        # 预加载当前页之后的3页
+        pages = [(sort_by, current_page + i) for i in range(1, 4) if current_page + i <= total_pages]
+        if not pages:  # 当前页是最后一页时不预加载
+            return
+        try:
+            loaded = await self.client.preload(self.app_id, pages, self.preloaded_data)
+            print(f"智能预加载完成: 新加载 {loaded}/{len(pages)} 个页面")
+        except Exception as e:
+            print(f"智能预加载任务异常: {e}")
 
     async def _fetch_workshop_items(self, sort_by: str, search_term: str, page: int) -> Optional[Dict]:
         """获取创意工坊物品信息"""
         try:
             # 检查预加载数据
-            if (search_term == '' and 
-                sort_by in self.preloaded_data and 
-                page in self.preloaded_data[sort_by]):
-                return self.preloaded_data[sort_by][page]
+            if search_term == '':
+                preloaded = self.preloaded_data.get((self.app_id, sort_by, page))
+                if preloaded is not None:
+                    return preloaded
             
-            # 如果没有预加载数据，则实时获取
-            result = await asyncio.get_event_loop().run_in_executor(
-                None, 
-                self.service.get_workshop_items,
-                self.app_id, sort_by, search_term, page
-            )
+            # 如果没有预加载数据，则直接在事件循环中异步获取
+            result = await self.client.get_workshop_items(self.app_id, sort_by, search_term, page)
+            if result and search_term == '':
+                self.preloaded_data.put((self.app_id, sort_by, page), result)
             return result
         except Exception as e:
             print(f"获取创意工坊数据失败: {e}")
@@ -567,9 +464,6 @@ class SteamWorkshopPage:
         if not mod_id:
             return
             
-        # 检查当前订阅状态
-        is_currently_subscribed = mod_manager.is_mod_downloaded(mod_id)
-        
         # 无论当前状态如何，都引导用户到Steam页面操作
         # 查找该mod的信息
         mod_info = None
@@ -595,8 +489,8 @@ class SteamWorkshopPage:
         if not mod_id:
             return False
             
-        # 使用模组管理器检查模组是否已下载
-        return mod_manager.is_mod_downloaded(mod_id)
+        # 使用本次加载时获取的已下载模组ID，不再逐个检查目录
+        return mod_id in self.downloaded_mod_ids
 
     def _create_items_grid(self, items: List[Dict]) -> ft.Control:
         """创建模组展示网格"""
@@ -767,6 +661,9 @@ class SteamWorkshopPage:
             if result:
                 self.current_data.update(result)
                 
+                # 一次获取全部已下载模组的ID，供日志和卡片判断下载状态
+                self.downloaded_mod_ids = mod_manager.get_downloaded_mod_ids()
+                
                 # 添加日志记录当前显示的在线mods信息
                 print(f"当前显示的在线mods信息 (共{len(result.get('items', []))}个):")
                 for i, item in enumerate(result.get('items', [])):
@@ -774,13 +671,12 @@ class SteamWorkshopPage:
                     mod_name = item.get('name', '未知名称')
                     mod_author = item.get('author', '未知作者')
                     # 检查mod是否已下载
-                    is_downloaded = mod_manager.is_mod_downloaded(mod_id)
+                    is_downloaded = mod_id in self.downloaded_mod_ids
                     status = "已下载" if is_downloaded else "未下载"
                     print(f"  {i+1}. ID: {mod_id}, 名称: {mod_name}, 作者: {mod_author}, 状态: {status}")
                 
                 # 更新下载状态显示
-                downloaded_mods = mod_manager.get_downloaded_mods()
-                downloaded_count = len(downloaded_mods)
+                downloaded_count = len(self.downloaded_mod_ids)
                 self.download_status.content.controls[1].value = f"已下载模组: {downloaded_count}"
                 
                 # 更新UI
@@ -794,8 +690,9 @@ class SteamWorkshopPage:
                 if self.top_button:
                     self.top_button.visible = True
                 
-                # 智能预加载后续页面
-                self.smart_preload(
+                # 智能预加载后续页面（作为独立任务运行，不阻塞本次渲染）
+                self.page.run_task(
+                    self.smart_preload,
                     self.current_data['sort_by'],
                     self.current_data['current_page'],
                     self.current_data['total_pages']
@@ -966,22 +863,13 @@ def steam_workshop_view(page: ft.Page):
     workshop_page = SteamWorkshopPage(page)
     view = workshop_page.create_view()
     
-    # 在页面创建后立即触发异步加载
-    def on_view_created(e):
-        # 使用Flet的异步处理方式
-        page.run_task(workshop_page._load_workshop_items)
-        # 开始预加载
-        page.run_task(workshop_page.start_preloading_async)
-    
-    # 使用定时器延迟执行，确保页面已经完全渲染
-    import threading
-    def delayed_load():
-        import time
-        time.sleep(0.1)  # 延迟100ms确保页面渲染完成
-        page.run_task(workshop_page._load_workshop_items)
-        # 使用普通线程启动预加载
-        workshop_page.start_preloading()
+    async def delayed_load():
+        """延迟加载，确保页面已经完全渲染"""
+        await asyncio.sleep(0.1)  # 延迟100ms确保页面渲染完成
+        # 先加载当前页，再在同一事件循环中预加载其他页面
+        await workshop_page._load_workshop_items()
+        await workshop_page.start_preloading()
     
-    threading.Thread(target=delayed_load).start()
+    page.run_task(delayed_load)
     
     return view
\ No newline at end of file
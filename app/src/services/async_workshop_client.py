@@ -0,0 +1,303 @@
+# services/async_workshop_client.py
+import asyncio
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import httpx
+
+from .http_session import DEFAULT_USER_AGENT
+from .lru_cache import LRUCache
+from .steam_workshop_service import SteamWorkshopService
+
+# 重试的状态码，与同步会话一致
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# 服务器确认缓存内容未变化（304）
+_NOT_MODIFIED = object()
+
+
+class AsyncWorkshopClient:
+    """
+    基于asyncio的创意工坊数据获取引擎
+
+    在页面的事件循环中持有一个httpx.AsyncClient连接池，并用信号量限制同时进行的请求数，
+    页面通过page.run_task直接调用，翻页和预加载不再为每次导航创建线程和线程池。
+    请求参数、数据来源选择和解析由SteamWorkshopService提供，结果写入创意工坊磁盘缓存。
+    """
+
+    def __init__(self, service: Optional[SteamWorkshopService] = None, max_concurrency: int = 6,
+                 retries: int = 3, backoff_factor: float = 0.5):
+        """
+        Args:
+            service (SteamWorkshopService, optional): 提供请求参数、缓存和解析的服务
+            max_concurrency (int): 同时进行的最大请求数
+            retries (int): 连接错误、429和5xx响应的最大重试次数
+            backoff_factor (float): 退避系数，第n次重试前等待 backoff_factor * 2^(n-1) 秒
+        """
+        self.service = service or SteamWorkshopService()
+        self.max_concurrency = max_concurrency
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        # 连接池和信号量都属于创建它们的事件循环，循环变化时重新创建
+        self._client: Optional[httpx.AsyncClient] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # 正在预加载的页面，同一页面同时被多次请求预加载时共用一个任务
+        self._inflight: Dict[Tuple, asyncio.Future] = {}
+
+    async def _get_client(self) -> Tuple[httpx.AsyncClient, asyncio.Semaphore]:
+        """获取当前事件循环的连接池和信号量（首次调用或事件循环变化时创建）"""
+        loop = asyncio.get_running_loop()
+        if self._client is not None and self._loop is not loop:
+            await self._close_client(self._client, self._loop)
+            self._client = None
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                headers={'User-Agent': DEFAULT_USER_AGENT},
+                timeout=15,
+                follow_redirects=True,
+                limits=httpx.Limits(max_connections=self.max_concurrency * 2,
+                                    max_keepalive_connections=self.max_concurrency),
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._loop = loop
+        return self._client, self._semaphore
+
+    @staticmethod
+    async def _close_client(client: httpx.AsyncClient, loop: Optional[asyncio.AbstractEventLoop]):
+        """关闭属于另一个事件循环的连接池：该循环仍在运行时交给它关闭，否则在当前循环中关闭"""
+        try:
+            if loop is not None and loop.is_running() and not loop.is_closed():
+                asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+            else:
+                await client.aclose()
+        except Exception as e:
+            print(f"关闭旧的连接池时出错: {e}")
+
+    async def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """
+        发送请求，GET和HEAD遇到连接错误、429和5xx响应时按指数退避重试
+
+        重试用尽后返回最后一次的响应，由调用方的raise_for_status处理。
+        """
+        client, semaphore = await self._get_client()
+        retries = self.retries if method in ("GET", "HEAD") else 0
+        attempt = 0
+        while True:
+            try:
+                async with semaphore:
+                    response = await client.request(method, url, **kwargs)
+                if response.status_code not in RETRY_STATUSES or attempt >= retries:
+                    return response
+                delay = self._retry_after(response)
+            except httpx.TransportError:
+                if attempt >= retries:
+                    raise
+                delay = None
+            attempt += 1
+            if delay is None:
+                delay = self.backoff_factor * (2 ** (attempt - 1))
+            # 等待期间释放信号量，不占用其他请求的名额
+            await asyncio.sleep(delay)
+
+    @staticmethod
+    def _retry_after(response: httpx.Response) -> Optional[float]:
+        """读取Retry-After响应头（秒数形式）"""
+        try:
+            return min(float(response.headers.get('Retry-After', '')), 30.0)
+        except ValueError:
+            return None
+
+    async def get_workshop_items(self, app_id: str, sort_by: str = 'most_popular',
+                                 search_term: str = '', page: int = 1) -> Optional[Dict]:
+        """
+        获取Steam创意工坊物品信息
+
+        Args:
+            app_id (str): 游戏ID
+            sort_by (str): 排序方式 ('most_popular', 'top_rated', 'newest', 'last_updated')
+            search_term (str): 搜索关键词
+            page (int): 页码
+
+        Returns:
+            Optional[Dict]: 包含物品信息列表和分页信息的字典，请求失败且没有缓存时返回None
+        """
+        service = self.service
+        service.validate_sort(sort_by)
+        backend = service.get_backend()
+        cache_key = service.cache_key(app_id, sort_by, search_term, page, backend)
+
+        async def fetch(cached):
+            if backend == "web_api":
+                result = await self.query_files(app_id, sort_by, search_term, page)
+                if result is None:
+                    return None
+                await self.resolve_author_names(result['items'])
+                return result, None, None
+            return await self._fetch_browse_page(app_id, sort_by, search_term, page, cached)
+
+        return await self._cached_fetch(cache_key, fetch)
+
+    async def _cached_fetch(self, cache_key: Tuple, fetch) -> Optional[Dict]:
+        """
+        按磁盘缓存获取数据：有效期内直接返回缓存，过期时把缓存条目交给fetch做条件请求
+
+        Args:
+            cache_key (tuple): 缓存键
+            fetch (callable): 协程函数，参数为过期的缓存条目（可能为None），返回
+                (数据, ETag, Last-Modified)；内容未变化时返回_NOT_MODIFIED，请求失败时返回None
+
+        Returns:
+            Optional[Dict]: 数据，请求失败时退回到过期的缓存
+        """
+        cache = self.service.cache
+        # 缓存读写是文件操作，放到线程中执行，避免阻塞事件循环
+        cached = await asyncio.to_thread(cache.get, cache_key)
+        if cached is not None and cache.is_fresh(cached):
+            return cached['data']
+
+        fetched = await fetch(cached)
+        if fetched is _NOT_MODIFIED and cached is not None:
+            # 内容未变化，只刷新缓存时间
+            await asyncio.to_thread(cache.touch, cache_key)
+            return cached['data']
+        if fetched is None or fetched is _NOT_MODIFIED:
+            # 网络不可用时退回到过期的缓存
+            return cached['data'] if cached is not None else None
+
+        data, etag, last_modified = fetched
+        await asyncio.to_thread(cache.put, cache_key, data, etag, last_modified)
+        return data
+
+    async def _fetch_browse_page(self, app_id: str, sort_by: str, search_term: str, page: int,
+                                 cached: Optional[Dict]):
+        """请求并解析浏览页，有过期缓存时带上条件请求头"""
+        service = self.service
+        url, headers = service.browse_request(app_id, sort_by, search_term, page, cached)
+        try:
+            response = await self._request("GET", url, headers=headers)
+            if response.status_code == 304:
+                return _NOT_MODIFIED
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            print(f"获取页面时出错: {e}")
+            return None
+
+        # 解析是CPU密集操作，放到事件循环的默认线程池中执行，避免阻塞界面
+        result = await asyncio.to_thread(service.parse_browse_page, response.text, page)
+        if service.should_enrich():
+            details_by_id = await self.get_published_file_details(
+                item['id'] for item in result['items'] if item.get('id'))
+            service.web_api.apply_details(result['items'], details_by_id)
+        return result, response.headers.get('ETag'), response.headers.get('Last-Modified')
+
+    async def query_files(self, app_id: str, sort_by: str = 'most_popular', search_term: str = '',
+                          page: int = 1, per_page: int = 30) -> Optional[Dict]:
+        """通过Steam Web API的QueryFiles分页列出创意工坊物品，请求失败时返回None"""
+        web_api = self.service.web_api
+        params = web_api.query_files_params(app_id, sort_by, search_term, page, per_page)
+        try:
+            response = await self._request("GET", web_api.query_files_url, params=params)
+            response.raise_for_status()
+            data = response.json().get('response', {})
+        except (httpx.HTTPError, ValueError) as e:
+            print(f"查询创意工坊物品时出错: {e}")
+            return None
+        return web_api.build_query_result(data, app_id, page, per_page)
+
+    async def get_published_file_details(self, item_ids: Iterable[str]) -> Dict[str, Dict]:
+        """
+        批量获取物品详细信息，每次POST最多包含100个物品，各批次并发请求
+
+        Returns:
+            Dict[str, Dict]: 物品ID -> 原始详细信息，获取失败或不存在的物品不包含在内
+        """
+        web_api = self.service.web_api
+
+        async def post(form):
+            try:
+                response = await self._request("POST", web_api.file_details_url, data=form)
+                response.raise_for_status()
+                return response.json().get('response', {})
+            except (httpx.HTTPError, ValueError) as e:
+                print(f"获取创意工坊物品详情时出错: {e}")
+                return {}
+
+        details_by_id = {}
+        for data in await asyncio.gather(*(post(form) for form in web_api.file_details_forms(item_ids))):
+            web_api.collect_details(data, details_by_id)
+        return details_by_id
+
+    async def resolve_author_names(self, items: List[Dict]) -> List[Dict]:
+        """
+        用GetPlayerSummaries把QueryFiles物品的作者SteamID换成昵称，已缓存的作者不再请求
+
+        获取失败的作者保留占位名称。
+        """
+        web_api = self.service.web_api
+
+        async def get(params):
+            try:
+                response = await self._request("GET", web_api.player_summaries_url, params=params)
+                response.raise_for_status()
+                return response.json().get('response', {})
+            except (httpx.HTTPError, ValueError) as e:
+                print(f"获取作者昵称时出错: {e}")
+                return {}
+
+        for data in await asyncio.gather(*(get(params) for params in web_api.player_summaries_params(items))):
+            web_api.collect_persona_names(data)
+        return web_api.apply_persona_names(items)
+
+    async def preload(self, app_id: str, pages: Iterable[Tuple[str, int]], cache: LRUCache) -> int:
+        """
+        并发预加载多个浏览页到内存缓存，已缓存的页面跳过
+
+        Args:
+            app_id (str): 游戏ID
+            pages (Iterable[Tuple[str, int]]): (排序方式, 页码)
+            cache (LRUCache): 预加载缓存，键为 (app_id, 排序方式, 页码)
+
+        Returns:
+            int: 本次新加载的页面数
+        """
+        async def load_page(key, sort_by, page):
+            try:
+                result = await self.get_workshop_items(app_id, sort_by, '', page)
+            except Exception as e:
+                print(f"预加载失败 {sort_by} 第{page}页: {e}")
+                return False
+            finally:
+                self._inflight.pop(key, None)
+            if not result:
+                return False
+            cache.put(key, result)
+            return True
+
+        async def preload_single_page(sort_by, page):
+            key = (app_id, sort_by, page)
+            if key in cache:
+                return False
+            task = self._inflight.get(key)
+            if task is not None:
+                # 其他预加载正在获取这一页，等待它完成即可（不重复计数）
+                await asyncio.shield(task)
+                return False
+            task = asyncio.ensure_future(load_page(key, sort_by, page))
+            self._inflight[key] = task
+            return await asyncio.shield(task)
+
+        pages: List[Tuple[str, int]] = list(pages)
+        loaded = await asyncio.gather(*(preload_single_page(sort_by, page) for sort_by, page in pages))
+        return sum(loaded)
+
+    async def aclose(self):
+        """关闭连接池（需在创建它的事件循环中调用）"""
+        if self._client is not None and self._loop is asyncio.get_running_loop():
+            await self._client.aclose()
+        self._client = None
+        self._semaphore = None
+        self._loop = None
+
+
+# 创建全局异步创意工坊客户端实例
+async_workshop_client = AsyncWorkshopClient()
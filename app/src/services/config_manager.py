@@ -18,6 +18,17 @@ DEFAULT_CONFIG = {
     "last_update_check": None,  # 最后检查更新时间
     "current_version": "0.1.1",  # 当前应用版本
     "skip_version": None,  # 跳过的版本号
+    # 模组扫描相关配置
+    "mod_scan_workers": 8,  # 并行读取模组信息的线程数
+    "mods_view_mode": "pages",  # 模组页面浏览模式：pages（分页）或 scroll（滚动浏览）
+    # 创意工坊相关配置
+    "workshop_cache_ttl": 600,  # 创意工坊浏览页缓存有效期（秒）
+    "workshop_parser": "auto",  # 浏览页解析后端：auto、selectolax、lxml 或 soup
+    "workshop_backend": "auto",  # 物品列表来源：auto（有API密钥时用web_api）、web_api 或 html
+    "workshop_enrich_details": True,  # 解析浏览页后批量获取订阅数和收藏数
+    "steam_web_api_key": "",  # 可选，Steam Web API的QueryFiles接口需要
+    "steam_api_base_url": "https://api.steampowered.com",  # Steam Web API地址，测试时可改为本地模拟服务器
+    "remote_details_ttl": 21600,  # 本地模组创意工坊详情（标题、更新时间等）的缓存有效期（秒）
     # 移除了 steam_api_key 和 steam_id 配置项
 }
 
@@ -0,0 +1,132 @@
+# services/global_json_store.py
+import os
+import json
+import threading
+from typing import Any, Callable, Dict, Optional
+
+
+class GlobalJsonStore:
+    """
+    游戏存档Global.json的内存缓存
+
+    文件只在首次访问或修改时间变化时重新读取，启用状态直接从字典中查询。
+    修改先记录在内存中，由flush统一写回，多次修改只写一次文件。
+    写入时先写临时文件再替换，避免游戏读取到写了一半的存档。
+    """
+
+    def __init__(self, path_provider: Callable[[], str]):
+        """
+        Args:
+            path_provider (callable): 返回Global.json路径的函数
+        """
+        self._path_provider = path_provider
+        self._lock = threading.RLock()
+        self._path: Optional[str] = None
+        self._mtime: Optional[int] = None
+        self._data: Optional[Dict[str, Any]] = None
+        # 尚未写回文件的修改
+        self._pending: Dict[str, Any] = {}
+
+    @staticmethod
+    def mod_key(mod_name: str) -> str:
+        """获取模组在Global.json中的启用状态键名"""
+        return f"ModActive_{mod_name}"
+
+    def _ensure_loaded(self) -> Dict[str, Any]:
+        """确保内存数据与文件一致，文件被外部修改时重新读取并保留未写回的修改"""
+        path = self._path_provider()
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            mtime = None
+
+        if self._data is not None and path == self._path and mtime == self._mtime:
+            return self._data
+
+        data = {}
+        if mtime is not None:
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if not isinstance(data, dict):
+                    data = {}
+            except Exception as e:
+                print(f"读取Global.json时出错: {e}")
+                data = {}
+
+        if path != self._path:
+            # 存档路径变化时丢弃旧文件的修改
+            self._pending = {}
+        data.update(self._pending)
+
+        self._path = path
+        self._mtime = mtime
+        self._data = data
+        return data
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """获取Global.json中的配置项"""
+        with self._lock:
+            return self._ensure_loaded().get(key, default)
+
+    def is_mod_active(self, mod_name: str) -> bool:
+        """
+        检查模组是否已启用
+
+        Args:
+            mod_name (str): 模组显示名称
+
+        Returns:
+            bool: 如果模组已启用返回True，否则返回False
+        """
+        value = self.get(self.mod_key(mod_name))
+        if isinstance(value, dict):
+            return bool(value.get("value", False))
+        return False
+
+    def set_mod_active(self, mod_name: str, active: bool):
+        """
+        在内存中修改模组启用状态，需要调用flush写回文件
+
+        Args:
+            mod_name (str): 模组显示名称
+            active (bool): 是否启用
+        """
+        key = self.mod_key(mod_name)
+        value = {
+            "__type": "bool",
+            "value": active
+        }
+        with self._lock:
+            self._ensure_loaded()[key] = value
+            self._pending[key] = value
+
+    def flush(self) -> bool:
+        """
+        将未写回的修改写入文件
+
+        Returns:
+            bool: 写入成功或无需写入返回True，否则返回False
+        """
+        with self._lock:
+            if not self._pending:
+                return True
+
+            data = self._ensure_loaded()
+            path = self._path
+            temp_path = path + ".tmp"
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, ensure_ascii=False, indent=4)
+                os.replace(temp_path, path)
+            except Exception as e:
+                print(f"写入Global.json时出错: {e}")
+                # 丢弃未写入的修改，下次访问时按文件内容重新读取
+                self._pending = {}
+                self._data = None
+                return False
+
+            self._mtime = os.stat(path).st_mtime_ns
+            self._pending = {}
+            return True
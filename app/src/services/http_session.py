@@ -0,0 +1,75 @@
+# services/http_session.py
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    # urllib3只有在安装了brotli时才能解码br压缩的响应
+    import brotli  # noqa: F401
+    _ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        _ACCEPT_ENCODING = "gzip, deflate, br"
+    except ImportError:
+        _ACCEPT_ENCODING = "gzip, deflate"
+
+DEFAULT_USER_AGENT = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+)
+
+
+def create_session(pool_connections: int = 8, pool_maxsize: int = 16,
+                   retries: int = 3, backoff_factor: float = 0.5) -> requests.Session:
+    """
+    创建带连接池和重试的HTTP会话
+
+    同一主机的连接会被复用（keep-alive），避免每个请求都重新进行TCP和TLS握手。
+    遇到连接错误、429和5xx响应时按指数退避重试，并遵循Retry-After响应头。
+
+    Args:
+        pool_connections (int): 缓存连接池的主机数量
+        pool_maxsize (int): 每个主机的最大连接数，连接用尽时其他线程等待空闲连接，而不是临时新建连接
+        retries (int): 最大重试次数
+        backoff_factor (float): 退避系数，第n次重试前等待 backoff_factor * 2^(n-1) 秒
+
+    Returns:
+        requests.Session: 配置好的会话
+    """
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        # 重试用尽后返回最后一次的响应，由调用方的raise_for_status处理
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize,
+                          max_retries=retry, pool_block=True)
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({
+        'User-Agent': DEFAULT_USER_AGENT,
+        'Accept-Encoding': _ACCEPT_ENCODING,
+    })
+    return session
+
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """获取所有服务共用的HTTP会话（首次调用时创建）"""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = create_session()
+    return _session
@@ -0,0 +1,166 @@
+# services/lru_cache.py
+import json
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from .workshop_cache import WorkshopResponseCache
+
+# 未命中时的默认返回值标记
+_MISSING = object()
+
+
+def _json_size(value: Any) -> int:
+    """按JSON编码后的字节数估算条目大小"""
+    try:
+        return len(json.dumps(value, ensure_ascii=False, default=str).encode('utf-8'))
+    except (TypeError, ValueError):
+        return 0
+
+
+class LRUCache:
+    """
+    线程安全的有界LRU缓存
+
+    同时按条目数和估算的字节数限制容量，超出任一限制时淘汰最久未使用的条目；
+    条目超过有效期后在下次访问或写入时移除。所有操作都在同一个可重入锁下进行，
+    页面和后台预加载线程可以共用一个实例。
+    """
+
+    def __init__(self, max_entries: int = 64, max_bytes: int = 8 * 1024 * 1024,
+                 ttl: Optional[float] = None, size_func: Callable[[Any], int] = _json_size):
+        """
+        Args:
+            max_entries (int): 最大条目数
+            max_bytes (int): 所有条目估算大小之和的上限（字节）
+            ttl (float, optional): 条目有效期（秒），为None时不过期
+            size_func (callable): 估算条目大小的函数，默认按JSON编码长度计算
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._size_func = size_func
+        self._lock = threading.RLock()
+        # 键 -> (值, 写入时间, 估算大小)，按最近使用顺序排列
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def _is_expired(self, stored_at: float, now: float) -> bool:
+        return self.ttl is not None and now - stored_at >= self.ttl
+
+    def _remove(self, key: Hashable):
+        _, _, size = self._entries.pop(key)
+        self._bytes -= size
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        获取条目并标记为最近使用
+
+        Args:
+            key: 缓存键
+            default: 未命中或已过期时的返回值
+
+        Returns:
+            缓存的值
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return default
+            if self._is_expired(entry[1], time.time()):
+                self._remove(key)
+                self._expirations += 1
+                self._misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def __contains__(self, key: Hashable) -> bool:
+        """是否存在未过期的条目（不计入命中统计，也不改变使用顺序）"""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and not self._is_expired(entry[1], time.time())
+
+    def put(self, key: Hashable, value: Any):
+        """
+        写入条目，超出容量时淘汰最久未使用的条目
+
+        Args:
+            key: 缓存键
+            value: 缓存的值
+        """
+        size = self._size_func(value)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if size > self.max_bytes:
+                # 单个条目超过总容量，缓存它只会把其他条目全部挤出
+                return
+            self._entries[key] = (value, time.time(), size)
+            self._bytes += size
+            self._evict()
+
+    def _evict(self):
+        """先移除过期条目，再按最近使用顺序淘汰直到满足容量限制"""
+        now = time.time()
+        if self.ttl is not None:
+            for key in [key for key, entry in self._entries.items() if self._is_expired(entry[1], now)]:
+                self._remove(key)
+                self._expirations += 1
+        while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+            self._remove(next(iter(self._entries)))
+            self._evictions += 1
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """移除并返回条目"""
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            if entry is _MISSING:
+                return default
+            self._remove(key)
+            return entry[0]
+
+    def clear(self):
+        """清空缓存（统计信息保留）"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        获取缓存统计信息
+
+        Returns:
+            Dict[str, Any]: 条目数、估算字节数、命中/未命中次数、命中率、淘汰和过期次数
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_rate': self._hits / lookups if lookups else 0.0,
+                'evictions': self._evictions,
+                'expirations': self._expirations,
+            }
+
+
+# 创意工坊页面预加载数据的共享缓存，键为 (app_id, 排序方式, 页码)
+# 页面重建后仍可使用之前预加载的页面；有效期与创意工坊磁盘缓存相同
+workshop_preload_cache = LRUCache(
+    max_entries=48,
+    max_bytes=8 * 1024 * 1024,
+    ttl=WorkshopResponseCache.get_ttl()
+)
@@ -55,6 +55,13 @@ class ModCollectionManager:
         """获取所有合集"""
         return self._load_collections()
     
+    def get_collected_mod_ids(self) -> set:
+        """获取属于任一合集的模组ID"""
+        mod_ids = set()
+        for collection in self.get_collections():
+            mod_ids.update(collection.get('mods', []))
+        return mod_ids
+    
     def get_collection_by_id(self, collection_id: str) -> Optional[Dict]:
         """根据ID获取特定合集"""
         collections = self.get_collections()
@@ -0,0 +1,152 @@
+# services/mod_index.py
+import os
+import json
+import threading
+from typing import Dict, Iterable, Optional
+
+
+class ModIndex:
+    """模组元数据持久化索引，按模组ID记录目录与info.ini的修改时间，冷启动时只重新解析发生变化的目录"""
+
+    def __init__(self, index_file: Optional[str] = None):
+        self.index_file = index_file or os.path.join(
+            os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            "data",
+            "mod_index.jsonl"
+        )
+        # 确保data目录存在
+        os.makedirs(os.path.dirname(self.index_file), exist_ok=True)
+        self._entries: Dict[str, Dict] = {}
+        self._loaded = False
+        self._dirty = False
+        # 扫描线程和目录监视器会同时访问索引，加载、修改和保存都需要加锁
+        # 使用可重入锁，修改时可以在锁内完成首次加载
+        self._lock = threading.RLock()
+
+    def _load(self):
+        """从JSON Lines文件加载索引（每行一个模组）"""
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            self._load_file()
+            self._loaded = True
+
+    def _load_file(self):
+        """读取索引文件内容"""
+        if not os.path.exists(self.index_file):
+            return
+
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # 跳过损坏的行，对应模组会被重新解析
+                        continue
+                    mod_id = entry.get('id')
+                    if mod_id and isinstance(entry.get('info'), dict):
+                        self._entries[mod_id] = entry
+        except Exception as e:
+            print(f"加载模组索引时出错: {e}")
+            self._entries = {}
+
+    @staticmethod
+    def get_mtimes(mod_path: str) -> tuple:
+        """
+        获取模组目录和info.ini的修改时间
+
+        Args:
+            mod_path (str): 模组路径
+
+        Returns:
+            tuple: (目录修改时间, info.ini修改时间)，info.ini不存在时为0
+        """
+        folder_mtime = os.stat(mod_path).st_mtime_ns
+        try:
+            ini_mtime = os.stat(os.path.join(mod_path, 'info.ini')).st_mtime_ns
+        except OSError:
+            ini_mtime = 0
+        return folder_mtime, ini_mtime
+
+    def lookup(self, mod_id: str, folder_mtime: int, ini_mtime: int) -> Optional[Dict]:
+        """
+        查找索引中的模组信息，只有修改时间完全一致时才命中
+
+        Args:
+            mod_id (str): 模组ID
+            folder_mtime (int): 当前目录修改时间
+            ini_mtime (int): 当前info.ini修改时间
+
+        Returns:
+            Optional[Dict]: 命中时返回模组信息副本，否则返回None
+        """
+        self._load()
+        entry = self._entries.get(mod_id)
+        if not entry:
+            return None
+        if entry.get('folder_mtime') != folder_mtime or entry.get('ini_mtime') != ini_mtime:
+            return None
+        return dict(entry['info'])
+
+    def update(self, mod_id: str, folder_mtime: int, ini_mtime: int, mod_info: Dict):
+        """记录模组信息及其对应的修改时间"""
+        self._load()
+        # 路径由扫描时重新拼接，大小由后台线程计算，均不写入索引
+        info = {key: value for key, value in mod_info.items()
+                if key not in ('path', 'size', 'size_bytes')}
+        with self._lock:
+            self._entries[mod_id] = {
+                'id': mod_id,
+                'folder_mtime': folder_mtime,
+                'ini_mtime': ini_mtime,
+                'info': info
+            }
+            self._dirty = True
+
+    def remove(self, mod_id: str):
+        """移除单个模组"""
+        self._load()
+        with self._lock:
+            if self._entries.pop(mod_id, None) is not None:
+                self._dirty = True
+
+    def prune(self, valid_ids: Iterable[str]):
+        """移除已不存在的模组"""
+        self._load()
+        valid_ids = set(valid_ids)
+        with self._lock:
+            for mod_id in list(self._entries):
+                if mod_id not in valid_ids:
+                    del self._entries[mod_id]
+                    self._dirty = True
+
+    def save(self):
+        """将索引写回磁盘（先写临时文件再替换，避免中途退出导致索引损坏）"""
+        with self._lock:
+            if not self._dirty:
+                return
+            # 每个线程使用自己的临时文件，避免同时保存时互相截断
+            temp_file = f"{self.index_file}.{threading.get_ident()}.tmp"
+            try:
+                with open(temp_file, 'w', encoding='utf-8') as f:
+                    for entry in self._entries.values():
+                        f.write(json.dumps(entry, ensure_ascii=False, separators=(',', ':')))
+                        f.write('\n')
+                os.replace(temp_file, self.index_file)
+                self._dirty = False
+            except Exception as e:
+                print(f"保存模组索引时出错: {e}")
+
+    def clear(self):
+        """清空索引"""
+        self._load()
+        with self._lock:
+            if self._entries:
+                self._entries = {}
+                self._dirty = True
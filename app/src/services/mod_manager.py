@@ -2,9 +2,21 @@
 import os
 import json
 import shutil
+import time
+import threading
 import configparser
-from typing import List, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Iterator, Optional, Set
 from .config_manager import config_manager
+from .mod_index import ModIndex
+from .size_accountant import DirectorySizeAccountant
+from .global_json_store import GlobalJsonStore
+from .mod_watcher import ModFolderWatcher
+from .mod_search_index import ModSearchIndex
+from .mod_state_writer import ModStateWriter
+
+# 大小尚未计算完成时显示的占位文本
+SIZE_PENDING = "计算中..."
 
 
 class ModManager:
@@ -12,22 +24,85 @@ class ModManager:
     
     def __init__(self):
         self.workshop_path = None
-        self._update_workshop_path()
+        # 上次解析创意工坊路径时的游戏目录，只有它变化时才需要重新解析并使缓存失效
+        self._game_directory = None
         # 添加缓存变量
         self._cached_mods = None
         self._cache_valid = False
+        # 缓存代数，模组列表内容每次变化时递增，页面据此判断是否需要重新渲染
+        self._cache_generation = 0
+        # 同一时间只进行一次完整扫描，扫描期间的其他调用方等待它完成后直接使用缓存
+        # 使用可重入锁，扫描线程在产出模组期间再次获取模组列表时不会死锁
+        self._scan_lock = threading.RLock()
+        # 持久化元数据索引，冷启动时跳过未变化的模组目录
+        self._mod_index = ModIndex()
+        # 目录大小统计器，只重新遍历修改时间变化的子目录
+        self._size_accountant = DirectorySizeAccountant()
+        # 后台计算模组大小的线程池及其任务
+        self._size_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="mod-size")
+        self._size_futures = []
+        self._size_listeners = []
+        # 模组ID与显示名称的双向索引，启用状态以 ModActive_{显示名称} 为键
+        self._id_to_name: Dict[str, str] = {}
+        self._name_to_ids: Dict[str, List[str]] = {}
+        # Global.json内存缓存，启用状态查询不再重复读取文件
+        self._global_store = GlobalJsonStore(self.get_global_json_path)
+        # 模组启用状态的后台写入器
+        self._state_writer = ModStateWriter(self.set_mods_enabled)
+        # 模组搜索倒排索引，及其对应的缓存代数
+        self._search_index = ModSearchIndex()
+        self._search_index_generation = None
+        # 创意工坊目录监视器，增量更新缓存的模组列表
+        self._watcher = None
+        self._change_listeners = []
+        # 最近一次扫描的统计信息（耗时、线程数、索引命中数），用于按机器调整扫描线程数
+        self.last_scan_stats = None
+        self._update_workshop_path()
     
     def _update_workshop_path(self):
-        """更新创意工坊路径"""
+        """更新创意工坊路径（仅在配置的游戏目录变化时重新解析）"""
+        game_directory = config_manager.get("game_directory", "")
+        if game_directory == self._game_directory:
+            return
+        self._game_directory = game_directory
         self.workshop_path = config_manager.get_steam_workshop_path()
         print(f"工作坊路径更新为: {self.workshop_path}")
-        # 路径改变时使缓存失效
+        # 路径改变时停止监视旧目录，并使缓存和名称索引失效
+        if self._watcher is not None:
+            self._watcher.stop()
+            self._watcher = None
+        self._id_to_name = {}
+        self._name_to_ids = {}
         self._invalidate_cache()
     
     def _invalidate_cache(self):
         """使缓存失效"""
         self._cache_valid = False
         self._cached_mods = None
+        self._cache_generation += 1
+    
+    def invalidate_cache(self):
+        """使缓存失效，下次获取时重新扫描模组目录（未变化的模组仍会命中元数据索引）"""
+        self._invalidate_cache()
+    
+    def has_cached_mods(self) -> bool:
+        """
+        检查模组列表是否已缓存
+        
+        Returns:
+            bool: 已缓存返回True，下次获取需要扫描时返回False
+        """
+        self._update_workshop_path()
+        return self._cache_valid and self._cached_mods is not None
+    
+    def get_cache_generation(self) -> int:
+        """
+        获取缓存代数
+        
+        Returns:
+            int: 模组列表每次重新扫描或增量更新后递增的计数
+        """
+        return self._cache_generation
     
     def get_downloaded_mods(self) -> List[Dict[str, str]]:
         """
@@ -37,49 +112,455 @@ class ModManager:
             List[Dict[str, str]]: 已下载模组的列表，每个模组包含id和路径信息
         """
         # 检查是否有有效缓存
-        if self._cache_valid and self._cached_mods is not None:
+        if self.has_cached_mods():
             print("使用缓存的模组列表")
             return self._cached_mods
-            
-        self._update_workshop_path()
         
+        downloaded_mods = list(self.iter_downloaded_mods())
+        return self._cached_mods if self._cache_valid else downloaded_mods
+    
+    def iter_downloaded_mods(self) -> Iterator[Dict[str, str]]:
+        """
+        逐个产出已下载的模组信息，每解析完一个模组立即产出，便于页面边扫描边渲染
+        
+        有缓存时直接产出缓存内容；完整遍历后扫描结果写入缓存，中途停止遍历则不缓存。
+        其他线程正在扫描时等待它完成，再产出它缓存的结果。
+        
+        Yields:
+            Dict[str, str]: 模组信息
+        """
+        if self.has_cached_mods():
+            yield from list(self._cached_mods)
+            return
+        
+        with self._scan_lock:
+            # 等待期间其他线程可能已完成扫描
+            if self.has_cached_mods():
+                yield from list(self._cached_mods)
+                return
+            yield from self._scan_downloaded_mods()
+    
+    def _scan_downloaded_mods(self) -> Iterator[Dict[str, str]]:
+        """完整扫描创意工坊目录（调用方需持有扫描锁）"""
         if not self.workshop_path or not os.path.exists(self.workshop_path):
             print(f"工作坊路径不存在: {self.workshop_path}")
-            return []
+            return
             
         downloaded_mods = []
+        index_hits = 0
+        workers = self._get_scan_workers()
+        # 扫描期间缓存被再次置为失效（刷新或游戏目录变化）时，本次结果已过时，不写入缓存
+        generation = self._cache_generation
+        # 名称索引随扫描逐个建立，页面边扫描边渲染时查询启用状态无需再次读取info.ini
+        self._id_to_name = {}
+        self._name_to_ids = {}
+        start_time = time.perf_counter()
         try:
-            # 遍历创意工坊目录下的所有子目录
-            for item in os.listdir(self.workshop_path):
-                item_path = os.path.join(self.workshop_path, item)
-                # 检查是否为目录且目录名是数字（模组ID）
-                if os.path.isdir(item_path) and item.isdigit():
-                    # 获取模组信息
-                    mod_info = self._get_mod_info(item, item_path)
+            # 遍历创意工坊目录下的所有子目录，目录名是数字（模组ID）的才是模组
+            with os.scandir(self.workshop_path) as entries:
+                mod_folders = sorted(
+                    entry.name for entry in entries
+                    if entry.name.isdigit() and entry.is_dir()
+                )
+            
+            # 多线程并行读取模组信息，map按输入顺序返回结果，保证列表顺序稳定
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="mod-scan") as executor:
+                for mod_info, index_hit in executor.map(self._scan_mod_folder, mod_folders):
+                    if mod_info is None:
+                        continue
+                    if index_hit:
+                        index_hits += 1
                     downloaded_mods.append(mod_info)
+                    self._index_mod_name(mod_info)
+                    yield mod_info
+            
+            # 移除已删除的模组并写回索引
+            self._mod_index.prune(mod['id'] for mod in downloaded_mods)
+            self._mod_index.save()
+            self._report_name_collisions()
         except Exception as e:
             print(f"获取已下载模组时出错: {e}")
-            
-        print(f"找到 {len(downloaded_mods)} 个已下载的模组")
+        
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        self.last_scan_stats = {
+            'mod_count': len(downloaded_mods),
+            'index_hits': index_hits,
+            'workers': workers,
+            'elapsed_ms': elapsed_ms
+        }
+        print(f"找到 {len(downloaded_mods)} 个已下载的模组（索引命中 {index_hits} 个，"
+              f"{workers} 个线程，耗时 {elapsed_ms:.1f} ms）")
+        
+        if generation != self._cache_generation:
+            print("扫描期间模组列表已失效，丢弃本次扫描结果")
+            return
         
         # 缓存结果
         self._cached_mods = downloaded_mods
         self._cache_valid = True
+        self._cache_generation += 1
+        
+        # 在后台补全模组大小
+        self._schedule_size_computation(downloaded_mods)
+        
+        # 监视目录变化，后续增删改由监视器增量更新
+        self._ensure_watcher()
+    
+    def _ensure_watcher(self):
+        """确保监视器正在监视当前的创意工坊目录"""
+        if self._watcher is not None:
+            if self._watcher.root_path == self.workshop_path:
+                return
+            self._watcher.stop()
+            self._watcher = None
+        if not self.workshop_path or not os.path.isdir(self.workshop_path):
+            return
+        self._watcher = ModFolderWatcher(self.workshop_path, self._apply_fs_changes)
+        self._watcher.start()
+    
+    def _apply_fs_changes(self, mod_ids):
+        """
+        将监视器报告的目录变化增量应用到缓存的模组列表
+        
+        Args:
+            mod_ids (Set[str]): 发生变化的模组ID集合
+        """
+        # 与完整扫描互斥，避免两者同时修改缓存和索引
+        with self._scan_lock:
+            self._apply_fs_changes_locked(mod_ids)
+    
+    def _apply_fs_changes_locked(self, mod_ids):
+        """增量更新缓存的模组列表（调用方需持有扫描锁）"""
+        if not self._cache_valid or self._cached_mods is None:
+            # 没有可更新的缓存，下次获取时会完整扫描
+            return
+        
+        mods_by_id = {mod['id']: mod for mod in self._cached_mods}
+        updated_mods = []
+        list_changed = False
+        for mod_id in sorted(mod_ids):
+            mod_path = os.path.join(self.workshop_path, mod_id)
+            # 目录内容已变化，丢弃该模组的大小缓存
+            self._size_accountant.invalidate(mod_path)
+            mod_info = None
+            if os.path.isdir(mod_path):
+                mod_info, _ = self._scan_mod_folder(mod_id)
+            
+            if mod_info is None:
+                if mods_by_id.pop(mod_id, None) is not None:
+                    print(f"模组已移除: {mod_id}")
+                    list_changed = True
+                self._mod_index.remove(mod_id)
+                self._unindex_mod_name(mod_id)
+            elif self._same_mod_info(mods_by_id.get(mod_id), mod_info):
+                # 模组信息没有变化（如只改动了模组内的文件），保留缓存条目，只重新计算大小
+                updated_mods.append(mods_by_id[mod_id])
+            else:
+                print(f"模组已{'更新' if mod_id in mods_by_id else '添加'}: {mod_id}")
+                mods_by_id[mod_id] = mod_info
+                self._index_mod_name(mod_info)
+                updated_mods.append(mod_info)
+                list_changed = True
         
-        return downloaded_mods
+        self._mod_index.save()
+        self._schedule_size_computation(updated_mods, cancel_pending=False)
+        if not list_changed:
+            # 列表内容没有变化，无需让页面重新渲染
+            return
+        
+        # 替换为新的列表对象，避免页面正在遍历的旧列表被修改
+        self._cached_mods = [mods_by_id[mod_id] for mod_id in sorted(mods_by_id)]
+        self._cache_generation += 1
+        
+        for listener in list(self._change_listeners):
+            try:
+                listener()
+            except Exception as e:
+                print(f"通知模组列表监听器时出错: {e}")
+    
+    @staticmethod
+    def _same_mod_info(cached_info: Optional[Dict[str, str]], mod_info: Dict[str, str]) -> bool:
+        """比较重新扫描的模组信息与缓存条目（忽略后台计算的大小）"""
+        if cached_info is None:
+            return False
+        ignored_keys = ('size', 'size_bytes')
+        return ({key: value for key, value in cached_info.items() if key not in ignored_keys}
+                == {key: value for key, value in mod_info.items() if key not in ignored_keys})
     
-    def get_downloaded_mods_paginated(self, page: int, page_size: int = 16) -> tuple[List[Dict[str, str]], int]:
+    def add_change_listener(self, listener):
+        """
+        添加模组列表变化的监听器（目录监视器增量更新缓存后调用）
+        
+        Args:
+            listener (callable): 监听器函数
+        """
+        if listener not in self._change_listeners:
+            self._change_listeners.append(listener)
+    
+    def remove_change_listener(self, listener):
+        """
+        移除模组列表变化的监听器
+        
+        Args:
+            listener (callable): 要移除的监听器函数
+        """
+        if listener in self._change_listeners:
+            self._change_listeners.remove(listener)
+    
+    def _get_scan_workers(self) -> int:
+        """获取扫描线程数（配置项 mod_scan_workers）"""
+        try:
+            workers = int(config_manager.get("mod_scan_workers", 8))
+        except (TypeError, ValueError):
+            workers = 8
+        return max(1, workers)
+    
+    def _scan_mod_folder(self, mod_id: str) -> tuple:
+        """
+        扫描单个模组目录，优先使用索引中的模组信息，目录或info.ini有变化时才重新解析
+        
+        Args:
+            mod_id (str): 模组ID
+            
+        Returns:
+            tuple: (模组信息, 是否命中索引)，目录无法访问时模组信息为None
+        """
+        mod_path = os.path.join(self.workshop_path, mod_id)
+        try:
+            folder_mtime, ini_mtime = ModIndex.get_mtimes(mod_path)
+        except OSError:
+            return None, False
+        
+        mod_info = self._mod_index.lookup(mod_id, folder_mtime, ini_mtime)
+        index_hit = mod_info is not None
+        if index_hit:
+            mod_info['path'] = mod_path
+            if 'sort_name' not in mod_info:
+                mod_info['sort_name'] = self._get_display_name(mod_info).casefold()
+        else:
+            # 大小由后台线程计算，这里只解析名称等信息
+            mod_info = self._get_mod_info(mod_id, mod_path, include_size=False)
+            # 名称排序键随模组信息一起存入索引
+            mod_info['sort_name'] = self._get_display_name(mod_info).casefold()
+            self._mod_index.update(mod_id, folder_mtime, ini_mtime, mod_info)
+        
+        mod_info['size'] = SIZE_PENDING
+        mod_info['size_bytes'] = None
+        return mod_info, index_hit
+    
+    @staticmethod
+    def _get_display_name(mod_info: Dict[str, str]) -> str:
+        """获取模组的显示名称（与游戏中ModActive_键使用的名称一致）"""
+        return mod_info.get('display_name', mod_info.get('name', f"模组 {mod_info['id']}"))
+    
+    def _report_name_collisions(self):
+        """扫描完成后报告显示名称冲突"""
+        for mod_name, mod_ids in self.get_name_collisions().items():
+            print(f"警告: 模组 {', '.join(mod_ids)} 的显示名称均为 \"{mod_name}\"，将共用同一个启用状态")
+    
+    def _index_mod_name(self, mod_info: Dict[str, str]):
+        """将单个模组加入名称索引（已存在时先移除旧名称）"""
+        mod_id = mod_info['id']
+        self._unindex_mod_name(mod_id)
+        mod_name = self._get_display_name(mod_info)
+        self._id_to_name[mod_id] = mod_name
+        self._name_to_ids.setdefault(mod_name, []).append(mod_id)
+    
+    def _unindex_mod_name(self, mod_id: str):
+        """从名称索引中移除模组"""
+        mod_name = self._id_to_name.pop(mod_id, None)
+        if mod_name is None:
+            return
+        mod_ids = self._name_to_ids.get(mod_name, [])
+        if mod_id in mod_ids:
+            mod_ids.remove(mod_id)
+        if not mod_ids:
+            self._name_to_ids.pop(mod_name, None)
+    
+    def _resolve_mod_name(self, mod_id: str) -> Optional[str]:
+        """
+        获取模组显示名称，优先从名称索引中查询
+        
+        Args:
+            mod_id (str): 模组ID
+            
+        Returns:
+            Optional[str]: 模组显示名称，模组不存在时返回None
+        """
+        # 游戏目录变化时会清空名称索引
+        self._update_workshop_path()
+        mod_name = self._id_to_name.get(mod_id)
+        if mod_name is not None:
+            return mod_name
+        
+        # 索引中没有该模组（尚未扫描或刚下载），读取其信息后加入索引
+        if not self.workshop_path:
+            print("工作坊路径为空")
+            return None
+        mod_path = os.path.join(self.workshop_path, mod_id)
+        if not os.path.isdir(mod_path):
+            print(f"源模组路径不存在: {mod_path}")
+            return None
+        mod_info = self._get_mod_info(mod_id, mod_path, include_size=False)
+        self._index_mod_name(mod_info)
+        return self._id_to_name[mod_id]
+    
+    def get_name_collisions(self) -> Dict[str, List[str]]:
+        """
+        获取显示名称冲突的模组
+        
+        Returns:
+            Dict[str, List[str]]: 显示名称 -> 共用该名称的模组ID列表（仅包含冲突项）
+        """
+        return {
+            mod_name: list(mod_ids)
+            for mod_name, mod_ids in self._name_to_ids.items()
+            if len(mod_ids) > 1
+        }
+    
+    def get_mods_sharing_name(self, mod_id: str) -> List[str]:
+        """
+        获取与指定模组显示名称相同的其他模组
+        
+        Args:
+            mod_id (str): 模组ID
+            
+        Returns:
+            List[str]: 其他模组ID列表
+        """
+        mod_name = self._id_to_name.get(mod_id)
+        if mod_name is None:
+            return []
+        return [other_id for other_id in self._name_to_ids.get(mod_name, []) if other_id != mod_id]
+    
+    def add_size_listener(self, listener):
+        """
+        添加模组大小计算完成的监听器
+        
+        Args:
+            listener (callable): 监听器函数，参数为 (mod_id, size, size_bytes)
+        """
+        if listener not in self._size_listeners:
+            self._size_listeners.append(listener)
+    
+    def remove_size_listener(self, listener):
+        """
+        移除模组大小计算完成的监听器
+        
+        Args:
+            listener (callable): 要移除的监听器函数
+        """
+        if listener in self._size_listeners:
+            self._size_listeners.remove(listener)
+    
+    def _schedule_size_computation(self, mods: List[Dict[str, str]], cancel_pending: bool = True):
+        """将模组大小计算任务提交到后台线程池，完整扫描时取消上一次扫描中尚未开始的任务"""
+        if cancel_pending:
+            for future in self._size_futures:
+                future.cancel()
+            self._size_futures = []
+        else:
+            self._size_futures = [future for future in self._size_futures if not future.done()]
+        self._size_futures.extend(
+            self._size_executor.submit(self._compute_mod_size, mod_info)
+            for mod_info in mods
+        )
+    
+    def _compute_mod_size(self, mod_info: Dict[str, str]):
+        """计算单个模组的大小，写回模组信息并通知监听器"""
+        size = self._size_accountant.get_size(mod_info['path'])
+        mod_info['size'] = size.formatted
+        mod_info['size_bytes'] = size.bytes
+        
+        for listener in list(self._size_listeners):
+            try:
+                listener(mod_info['id'], size.formatted, size.bytes)
+            except Exception as e:
+                print(f"通知模组大小监听器时出错: {e}")
+    
+    def search_mods(self, search_term: str) -> List[Dict[str, str]]:
+        """
+        在所有已下载的模组中搜索（名称、显示名称和描述）
+        
+        Args:
+            search_term (str): 搜索词，为空时返回全部模组
+            
+        Returns:
+            List[Dict[str, str]]: 命中的模组列表，保持原列表顺序
+        """
+        all_mods = self.get_downloaded_mods()
+        if not search_term or not search_term.strip():
+            return all_mods
+        
+        # 模组列表变化后重建索引
+        if self._search_index_generation != self._cache_generation:
+            self._search_index.build(all_mods)
+            self._search_index_generation = self._cache_generation
+        
+        mods_by_id = {mod['id']: mod for mod in all_mods}
+        return [mods_by_id[mod_id] for mod_id in self._search_index.search(search_term) if mod_id in mods_by_id]
+    
+    def query_mods(self, search_term: str = "", sort_by: str = "default", descending: bool = False,
+                   filter_by: str = "all", collection_mod_ids: Optional[set] = None) -> List[Dict[str, str]]:
+        """
+        搜索、筛选并排序模组
+        
+        只在内存中的模组信息上操作，不重新扫描目录。名称排序键在扫描时预先计算并存入索引，
+        大小使用后台计算出的字节数（尚未算出的排在最小），启用状态从内存中的Global.json读取。
+        
+        Args:
+            search_term (str): 搜索词
+            sort_by (str): 排序方式：default（目录顺序）、name、size、enabled
+            descending (bool): 是否倒序
+            filter_by (str): 筛选条件：all、enabled、disabled、in_collection、not_in_collection
+            collection_mod_ids (set, optional): 属于任一合集的模组ID，按合集筛选时使用
+            
+        Returns:
+            List[Dict[str, str]]: 模组列表
+        """
+        mods = self.search_mods(search_term)
+        
+        enabled_states = None
+        if filter_by in ("enabled", "disabled") or sort_by == "enabled":
+            enabled_states = {
+                mod['id']: self._global_store.is_mod_active(self._get_display_name(mod)) for mod in mods
+            }
+        
+        if filter_by in ("enabled", "disabled"):
+            wanted = filter_by == "enabled"
+            mods = [mod for mod in mods if enabled_states[mod['id']] == wanted]
+        elif filter_by in ("in_collection", "not_in_collection"):
+            collection_mod_ids = collection_mod_ids or set()
+            wanted = filter_by == "in_collection"
+            mods = [mod for mod in mods if (mod['id'] in collection_mod_ids) == wanted]
+        
+        if sort_by == "name":
+            mods = sorted(mods, key=lambda mod: mod['sort_name'], reverse=descending)
+        elif sort_by == "size":
+            mods = sorted(mods, key=lambda mod: mod.get('size_bytes') or 0, reverse=descending)
+        elif sort_by == "enabled":
+            # 启用的排在前面，同状态按名称排序
+            mods = sorted(mods, key=lambda mod: (not enabled_states[mod['id']], mod['sort_name']),
+                          reverse=descending)
+        elif descending:
+            mods = mods[::-1]
+        return mods
+    
+    def get_downloaded_mods_paginated(self, page: int, page_size: int = 16,
+                                      search_term: str = "", **query_options) -> tuple[List[Dict[str, str]], int]:
         """
         获取已下载的模组列表（分页版本）
         
         Args:
             page (int): 页码（从1开始）
             page_size (int): 每页数量，默认16
+            search_term (str): 搜索词，先在全部模组中搜索再分页
+            **query_options: 排序和筛选选项，见query_mods
             
         Returns:
             tuple[List[Dict[str, str]], int]: (模组列表, 总页数)
         """
-        all_mods = self.get_downloaded_mods()
+        all_mods = self.query_mods(search_term, **query_options)
         total_mods = len(all_mods)
         total_pages = (total_mods + page_size - 1) // page_size  # 向上取整
         
@@ -92,13 +573,14 @@ class ModManager:
         
         return page_mods, total_pages
     
-    def _get_mod_info(self, mod_id: str, mod_path: str) -> Dict[str, str]:
+    def _get_mod_info(self, mod_id: str, mod_path: str, include_size: bool = True) -> Dict[str, str]:
         """
         获取模组详细信息
         
         Args:
             mod_id (str): 模组ID
             mod_path (str): 模组路径
+            include_size (bool): 是否统计目录大小，只需要显示名称时传False
             
         Returns:
             Dict[str, str]: 模组信息
@@ -110,8 +592,11 @@ class ModManager:
             'display_name': f"模组 {mod_id}",
             'description': "暂无描述",
             'version': "1.0.0",
-            'size': self._get_directory_size(mod_path)
         }
+        if include_size:
+            size = self._size_accountant.get_size(mod_path)
+            mod_info['size'] = size.formatted
+            mod_info['size_bytes'] = size.bytes
         
         # 尝试从模组目录中的info.ini文件获取信息
         info_ini_path = os.path.join(mod_path, 'info.ini')
@@ -157,35 +642,14 @@ class ModManager:
             
         return mod_info
     
-    def _get_directory_size(self, path: str) -> str:
+    def get_downloaded_mod_ids(self) -> Set[str]:
         """
-        计算目录大小并返回格式化字符串
+        获取全部已下载模组的ID
         
-        Args:
-            path (str): 目录路径
-            
         Returns:
-            str: 格式化的大小字符串
+            Set[str]: 模组ID集合，用于一次渲染中批量判断模组是否已下载
         """
-        total_size = 0
-        try:
-            for dirpath, dirnames, filenames in os.walk(path):
-                for filename in filenames:
-                    filepath = os.path.join(dirpath, filename)
-                    if os.path.exists(filepath):
-                        total_size += os.path.getsize(filepath)
-        except:
-            pass
-            
-        # 格式化大小
-        if total_size < 1024:
-            return f"{total_size} B"
-        elif total_size < 1024 * 1024:
-            return f"{total_size // 1024} KB"
-        elif total_size < 1024 * 1024 * 1024:
-            return f"{total_size // (1024 * 1024)} MB"
-        else:
-            return f"{total_size // (1024 * 1024 * 1024)} GB"
+        return {mod_info['id'] for mod_info in self.get_downloaded_mods()}
     
     def is_mod_downloaded(self, mod_id: str) -> bool:
         """
@@ -250,30 +714,13 @@ class ModManager:
             bool: 如果模组已启用返回True，否则返回False
         """
         try:
-            # 获取模组信息以获取显示名称
-            mod_info = self._get_mod_info(mod_id, os.path.join(self.workshop_path, mod_id))
-            mod_name = mod_info.get('display_name', mod_info.get('name', f'模组 {mod_id}'))
-            
-            # 获取Global.json文件路径
-            global_json_path = self.get_global_json_path()
-            
-            # 如果文件不存在，创建一个默认的
-            if not os.path.exists(global_json_path):
-                default_content = {}
-                with open(global_json_path, 'w', encoding='utf-8') as f:
-                    json.dump(default_content, f, ensure_ascii=False, indent=4)
+            # 从名称索引中获取显示名称
+            mod_name = self._resolve_mod_name(mod_id)
+            if mod_name is None:
                 return False
             
-            # 读取Global.json文件
-            with open(global_json_path, 'r', encoding='utf-8') as f:
-                global_data = json.load(f)
-            
-            # 检查对应的模组启用状态
-            mod_key = f"ModActive_{mod_name}"
-            if mod_key in global_data and isinstance(global_data[mod_key], dict):
-                return global_data[mod_key].get("value", False)
-            
-            return False
+            # 从Global.json缓存中检查对应的模组启用状态
+            return self._global_store.is_mod_active(mod_name)
         except Exception as e:
             print(f"检查模组启用状态时出错: {e}")
             return False
@@ -289,44 +736,15 @@ class ModManager:
             bool: 如果启用成功返回True，否则返回False
         """
         try:
-            # 获取源模组路径
-            self._update_workshop_path()
-            if not self.workshop_path:
-                print("工作坊路径为空")
-                return False
-                
-            source_mod_path = os.path.join(self.workshop_path, mod_id)
-            if not os.path.exists(source_mod_path):
-                print(f"源模组路径不存在: {source_mod_path}")
+            # 从名称索引中获取显示名称
+            mod_name = self._resolve_mod_name(mod_id)
+            if mod_name is None:
                 return False
             
-            # 获取模组信息以获取显示名称
-            mod_info = self._get_mod_info(mod_id, source_mod_path)
-            mod_name = mod_info.get('display_name', mod_info.get('name', f'模组 {mod_id}'))
-            
-            # 获取Global.json文件路径
-            global_json_path = self.get_global_json_path()
-            
-            # 如果文件不存在，创建一个默认的
-            if not os.path.exists(global_json_path):
-                default_content = {}
-                with open(global_json_path, 'w', encoding='utf-8') as f:
-                    json.dump(default_content, f, ensure_ascii=False, indent=4)
-            
-            # 读取Global.json文件
-            with open(global_json_path, 'r', encoding='utf-8') as f:
-                global_data = json.load(f)
-            
-            # 更新模组启用状态
-            mod_key = f"ModActive_{mod_name}"
-            global_data[mod_key] = {
-                "__type": "bool",
-                "value": True
-            }
-            
-            # 写入修改后的内容
-            with open(global_json_path, 'w', encoding='utf-8') as f:
-                json.dump(global_data, f, ensure_ascii=False, indent=4)
+            # 更新模组启用状态并写回Global.json
+            self._global_store.set_mod_active(mod_name, True)
+            if not self._global_store.flush():
+                return False
             
             print(f"模组 {mod_id} ({mod_name}) 启用成功")
             return True
@@ -347,45 +765,15 @@ class ModManager:
             bool: 如果禁用成功返回True，否则返回False
         """
         try:
-            # 获取源模组路径
-            self._update_workshop_path()
-            if not self.workshop_path:
-                print("工作坊路径为空")
-                return False
-                
-            source_mod_path = os.path.join(self.workshop_path, mod_id)
-            if not os.path.exists(source_mod_path):
-                print(f"源模组路径不存在: {source_mod_path}")
+            # 从名称索引中获取显示名称
+            mod_name = self._resolve_mod_name(mod_id)
+            if mod_name is None:
                 return False
             
-            # 获取模组信息以获取显示名称
-            mod_info = self._get_mod_info(mod_id, source_mod_path)
-            mod_name = mod_info.get('display_name', mod_info.get('name', f'模组 {mod_id}'))
-            
-            # 获取Global.json文件路径
-            global_json_path = self.get_global_json_path()
-            
-            # 如果文件不存在，创建一个默认的
-            if not os.path.exists(global_json_path):
-                default_content = {}
-                with open(global_json_path, 'w', encoding='utf-8') as f:
-                    json.dump(default_content, f, ensure_ascii=False, indent=4)
-                return True
-            
-            # 读取Global.json文件
-            with open(global_json_path, 'r', encoding='utf-8') as f:
-                global_data = json.load(f)
-            
-            # 更新模组启用状态
-            mod_key = f"ModActive_{mod_name}"
-            global_data[mod_key] = {
-                "__type": "bool",
-                "value": False
-            }
-            
-            # 写入修改后的内容
-            with open(global_json_path, 'w', encoding='utf-8') as f:
-                json.dump(global_data, f, ensure_ascii=False, indent=4)
+            # 更新模组启用状态并写回Global.json
+            self._global_store.set_mod_active(mod_name, False)
+            if not self._global_store.flush():
+                return False
             
             print(f"模组 {mod_id} ({mod_name}) 禁用成功")
             return True
@@ -394,7 +782,76 @@ class ModManager:
             import traceback
             traceback.print_exc()
             return False
-
+    
+    def batch_enable_mods(self, mod_ids: List[str]) -> Dict[str, bool]:
+        """
+        批量启用模组，所有修改只写入一次Global.json
+        
+        Args:
+            mod_ids (List[str]): 模组ID列表
+            
+        Returns:
+            Dict[str, bool]: 每个模组ID对应的启用结果
+        """
+        return self.set_mods_enabled({mod_id: True for mod_id in mod_ids})
+    
+    def batch_disable_mods(self, mod_ids: List[str]) -> Dict[str, bool]:
+        """
+        批量禁用模组，所有修改只写入一次Global.json
+        
+        Args:
+            mod_ids (List[str]): 模组ID列表
+            
+        Returns:
+            Dict[str, bool]: 每个模组ID对应的禁用结果
+        """
+        return self.set_mods_enabled({mod_id: False for mod_id in mod_ids})
+    
+    def set_mods_enabled(self, states: Dict[str, bool]) -> Dict[str, bool]:
+        """
+        批量设置模组启用状态，从缓存的模组信息中解析显示名称，在内存中修改全部状态后统一写回一次
+        
+        Args:
+            states (Dict[str, bool]): 模组ID -> 是否启用
+            
+        Returns:
+            Dict[str, bool]: 每个模组ID对应的设置结果
+        """
+        results = {}
+        if not states:
+            return results
+        
+        # 确保名称索引已根据扫描结果建立
+        self.get_downloaded_mods()
+        changed_ids = []
+        for mod_id, active in states.items():
+            mod_name = self._id_to_name.get(str(mod_id))
+            if mod_name is None:
+                print(f"批量{'启用' if active else '禁用'}时未找到模组: {mod_id}")
+                results[mod_id] = False
+                continue
+            self._global_store.set_mod_active(mod_name, active)
+            changed_ids.append(mod_id)
+        
+        written = self._global_store.flush() if changed_ids else True
+        for mod_id in changed_ids:
+            results[mod_id] = written
+        
+        print(f"批量设置模组启用状态: {len(changed_ids)}/{len(states)} 个{'成功' if written else '失败'}")
+        return results
+    
+    def set_mod_enabled_async(self, mod_id: str, enabled: bool, callback=None):
+        """
+        在后台设置模组启用状态，立即返回
+        
+        短时间内的多次修改会合并为一次Global.json写入，同一模组只写最后的状态。
+        
+        Args:
+            mod_id (str): 模组ID
+            enabled (bool): 是否启用
+            callback (callable, optional): 写入完成后调用，参数为 (模组ID, 启用状态, 是否成功)
+        """
+        self._state_writer.submit(mod_id, enabled, callback)
 
 # 创建全局模组管理器实例
 mod_manager = ModManager()
\ No newline at end of file
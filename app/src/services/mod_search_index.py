@@ -0,0 +1,148 @@
+# services/mod_search_index.py
+import re
+import bisect
+from typing import Dict, Iterable, List, Set
+
+try:
+    from pypinyin import lazy_pinyin
+except ImportError:
+    lazy_pinyin = None
+
+# 中日韩文字：汉字、平假名、片假名和韩文音节，不以空格分词，按单字和二元切分
+_CJK_RANGES = "\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff"
+_CJK_PATTERN = re.compile(f"[{_CJK_RANGES}]+")
+# 汉字（只有汉字需要生成拼音）
+_HAN_PATTERN = re.compile(r"[\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]+")
+# 其他文字（拉丁、西里尔等）的字母与数字组成的词
+_WORD_PATTERN = re.compile(f"[^\\W_{_CJK_RANGES}]+")
+
+# 参与索引的模组字段
+SEARCH_FIELDS = ('name', 'display_name', 'description')
+
+
+def tokenize(text: str) -> Set[str]:
+    """
+    将文本切分为索引词
+
+    拉丁、西里尔等文字按词切分，并加入词的每个后缀，前缀查找后缀即可匹配词中任意位置；
+    中日韩文字按单字和相邻两字（bigram）切分，安装了pypinyin时汉字还会加入从每个音节开始的
+    拼音全拼和首字母缩写（与拉丁文字的后缀相同），从标题中间开始的拼音也能匹配。
+
+    Args:
+        text (str): 文本
+
+    Returns:
+        Set[str]: 索引词集合
+    """
+    text = text.lower()
+    tokens = set()
+    for word in _WORD_PATTERN.findall(text):
+        tokens.update(word[i:] for i in range(len(word)))
+    for run in _CJK_PATTERN.findall(text):
+        tokens.update(run)
+        tokens.update(run[i:i + 2] for i in range(len(run) - 1))
+    if lazy_pinyin is not None:
+        for run in _HAN_PATTERN.findall(text):
+            syllables = [syllable for syllable in lazy_pinyin(run) if syllable]
+            initials = ''.join(syllable[0] for syllable in syllables)
+            for i in range(len(syllables)):
+                tokens.add(''.join(syllables[i:]))
+                tokens.add(initials[i:])
+    return tokens
+
+
+class ModSearchIndex:
+    """
+    模组倒排索引，按词查找模组ID
+
+    拉丁等文字按词内子串匹配，中日韩文字按二元切分匹配。查询中没有可索引的词（如只有标点），
+    或索引没有结果时（如查询跨越了词的边界），退回到对各字段做不区分大小写的子串匹配。
+    """
+
+    def __init__(self):
+        self._postings: Dict[str, Set[str]] = {}
+        # 排序后的索引词列表，用于前缀查找
+        self._sorted_tokens: List[str] = []
+        # 模组ID -> 在原列表中的位置，用于保持结果顺序
+        self._positions: Dict[str, int] = {}
+        # 模组ID -> 各字段小写后的文本，用于子串匹配
+        self._texts: Dict[str, List[str]] = {}
+
+    def build(self, mods: Iterable[Dict[str, str]]):
+        """
+        根据模组信息重建索引
+
+        Args:
+            mods (Iterable[Dict[str, str]]): 模组信息列表
+        """
+        postings: Dict[str, Set[str]] = {}
+        positions = {}
+        texts = {}
+        for position, mod_info in enumerate(mods):
+            mod_id = mod_info['id']
+            positions[mod_id] = position
+            texts[mod_id] = []
+            for field in SEARCH_FIELDS:
+                value = mod_info.get(field)
+                if not value:
+                    continue
+                texts[mod_id].append(str(value).lower())
+                for token in tokenize(str(value)):
+                    postings.setdefault(token, set()).add(mod_id)
+
+        self._postings = postings
+        self._sorted_tokens = sorted(postings)
+        self._positions = positions
+        self._texts = texts
+
+    def _prefix_matches(self, prefix: str) -> Set[str]:
+        """查找以指定前缀开头的所有索引词对应的模组"""
+        matches = set()
+        start = bisect.bisect_left(self._sorted_tokens, prefix)
+        for token in self._sorted_tokens[start:]:
+            if not token.startswith(prefix):
+                break
+            matches |= self._postings[token]
+        return matches
+
+    def search(self, query: str) -> List[str]:
+        """
+        搜索模组
+
+        查询中的每个词都必须命中（AND）。拉丁等文字的词匹配索引词中的任意位置，
+        中日韩文字按二元切分精确匹配，单个字按单字匹配。没有可索引的词或索引没有结果时，
+        按整个查询做子串匹配。
+
+        Args:
+            query (str): 搜索词
+
+        Returns:
+            List[str]: 命中的模组ID，按建索引时的顺序排列
+        """
+        query = query.lower()
+        if not query.strip():
+            return []
+        groups = [self._prefix_matches(word) for word in _WORD_PATTERN.findall(query)]
+        for run in _CJK_PATTERN.findall(query):
+            if len(run) == 1:
+                groups.append(self._postings.get(run, set()))
+            else:
+                groups.extend(self._postings.get(run[i:i + 2], set()) for i in range(len(run) - 1))
+
+        result = set()
+        if groups:
+            # 从最小的集合开始求交集
+            groups.sort(key=len)
+            result = set(groups[0])
+            for group in groups[1:]:
+                if not result:
+                    break
+                result &= group
+        if not result:
+            result = self._substring_matches(query.strip())
+        return sorted(result, key=lambda mod_id: self._positions.get(mod_id, 0))
+
+    def _substring_matches(self, query: str) -> Set[str]:
+        """在各字段中做不区分大小写的子串匹配"""
+        return {mod_id for mod_id, texts in self._texts.items()
+                if any(query in text for text in texts)}
@@ -0,0 +1,83 @@
+# services/mod_state_writer.py
+import time
+import threading
+from typing import Callable, Dict, List
+
+# 写入完成回调：(模组ID, 写入的启用状态, 是否成功)
+StateCallback = Callable[[str, bool, bool], None]
+
+
+class ModStateWriter:
+    """
+    模组启用状态的后台写入器
+
+    页面提交的状态修改先放入待写队列，写入线程在短暂的合并窗口后把队列中的修改
+    一次性写回Global.json。同一模组在窗口内多次切换时只写最后的状态，
+    写入完成后按模组回调提交方，失败时由提交方回滚界面。
+    """
+
+    def __init__(self, apply_func: Callable[[Dict[str, bool]], Dict[str, bool]], delay: float = 0.2):
+        """
+        Args:
+            apply_func (callable): 批量写入函数，参数为 {模组ID: 启用状态}，返回 {模组ID: 是否成功}
+            delay (float): 合并窗口（秒）
+        """
+        self._apply_func = apply_func
+        self._delay = delay
+        self._condition = threading.Condition()
+        self._pending: Dict[str, bool] = {}
+        self._callbacks: Dict[str, List[StateCallback]] = {}
+        self._thread = None
+
+    def submit(self, mod_id: str, enabled: bool, callback: StateCallback = None):
+        """
+        提交模组启用状态修改，立即返回
+
+        Args:
+            mod_id (str): 模组ID
+            enabled (bool): 是否启用
+            callback (callable, optional): 写入完成后在写入线程中调用
+        """
+        with self._condition:
+            self._pending[mod_id] = enabled
+            callbacks = self._callbacks.setdefault(mod_id, [])
+            if callback is not None and callback not in callbacks:
+                callbacks.append(callback)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True, name="mod-state-writer")
+                self._thread.start()
+            self._condition.notify()
+
+    def _run(self):
+        """写入线程：等待修改，合并窗口结束后统一写入"""
+        while True:
+            with self._condition:
+                while not self._pending:
+                    self._condition.wait()
+            # 合并窗口内的后续修改会覆盖同一模组的待写状态
+            time.sleep(self._delay)
+            self.flush()
+
+    def flush(self):
+        """立即写入所有待写的修改"""
+        with self._condition:
+            states = self._pending
+            callbacks = self._callbacks
+            self._pending = {}
+            self._callbacks = {}
+        if not states:
+            return
+
+        try:
+            results = self._apply_func(states)
+        except Exception as e:
+            print(f"写入模组启用状态时出错: {e}")
+            results = {}
+
+        for mod_id, enabled in states.items():
+            success = results.get(mod_id, False)
+            for callback in callbacks.get(mod_id, []):
+                try:
+                    callback(mod_id, enabled, success)
+                except Exception as e:
+                    print(f"通知模组 {mod_id} 启用状态写入结果时出错: {e}")
@@ -0,0 +1,175 @@
+# services/mod_watcher.py
+import os
+import threading
+from typing import Callable, Dict, Optional, Set, Tuple
+
+try:
+    # watchdog在Linux上使用inotify，在Windows上使用ReadDirectoryChangesW
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = object
+
+
+class _ModEventHandler(FileSystemEventHandler):
+    """
+    将创建、删除、移动和修改事件转发给监视器
+
+    打开、关闭等只读事件不会改变模组，忽略它们，
+    否则游戏加载模组或界面读取预览图都会被当成模组更新。
+    """
+
+    def __init__(self, watcher: "ModFolderWatcher"):
+        super().__init__()
+        self._watcher = watcher
+
+    def on_created(self, event):
+        self._watcher._on_path_event(event.src_path)
+
+    def on_deleted(self, event):
+        self._watcher._on_path_event(event.src_path)
+
+    def on_modified(self, event):
+        self._watcher._on_path_event(event.src_path)
+
+    def on_moved(self, event):
+        self._watcher._on_path_event(event.src_path)
+        self._watcher._on_path_event(event.dest_path)
+
+
+class ModFolderWatcher:
+    """
+    创意工坊内容目录监视器
+
+    优先使用系统文件事件（watchdog），不可用时退回定时轮询模组目录的修改时间。
+    事件按顶层模组目录归并，并在短暂的合并窗口后统一回调，
+    避免Steam下载模组时每写一个文件就触发一次更新。
+    """
+
+    def __init__(self, root_path: str, on_changes: Callable[[Set[str]], None],
+                 poll_interval: float = 5.0, debounce: float = 1.0):
+        """
+        Args:
+            root_path (str): 创意工坊内容目录
+            on_changes (callable): 回调函数，参数为发生变化的模组ID集合
+            poll_interval (float): 轮询模式下的检查间隔（秒）
+            debounce (float): 事件合并窗口（秒）
+        """
+        self.root_path = root_path
+        self._on_changes = on_changes
+        self._poll_interval = poll_interval
+        self._debounce = debounce
+        self._lock = threading.Lock()
+        self._pending: Set[str] = set()
+        self._timer: Optional[threading.Timer] = None
+        self._observer = None
+        self._poll_thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self.mode = None
+
+    def start(self):
+        """开始监视"""
+        if self.mode is not None:
+            return
+        if Observer is not None:
+            try:
+                observer = Observer()
+                observer.daemon = True
+                observer.schedule(_ModEventHandler(self), self.root_path, recursive=True)
+                observer.start()
+                self._observer = observer
+                self.mode = "events"
+                print(f"开始监视模组目录（文件事件）: {self.root_path}")
+                return
+            except Exception as e:
+                print(f"文件事件监视启动失败，改用轮询: {e}")
+
+        self._stop_event.clear()
+        self._poll_thread = threading.Thread(target=self._poll_loop, daemon=True, name="mod-watcher-poll")
+        self._poll_thread.start()
+        self.mode = "polling"
+        print(f"开始监视模组目录（轮询）: {self.root_path}")
+
+    def stop(self):
+        """停止监视"""
+        self._stop_event.set()
+        if self._observer is not None:
+            try:
+                self._observer.stop()
+            except Exception as e:
+                print(f"停止文件事件监视时出错: {e}")
+            self._observer = None
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._pending.clear()
+        self.mode = None
+
+    def _on_path_event(self, path: str):
+        """将事件路径归并到所属的顶层模组目录"""
+        try:
+            relative_path = os.path.relpath(path, self.root_path)
+        except ValueError:
+            return
+        mod_id = relative_path.split(os.sep, 1)[0]
+        if not mod_id.isdigit():
+            return
+
+        with self._lock:
+            self._pending.add(mod_id)
+            # 合并窗口内的后续事件只加入待处理集合，不重新计时
+            if self._timer is None:
+                self._timer = threading.Timer(self._debounce, self._flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _flush(self):
+        """回调合并窗口内发生变化的模组"""
+        with self._lock:
+            changed_ids = self._pending
+            self._pending = set()
+            self._timer = None
+        if not changed_ids or self._stop_event.is_set():
+            return
+        try:
+            self._on_changes(changed_ids)
+        except Exception as e:
+            print(f"处理模组目录变化时出错: {e}")
+
+    def _snapshot(self) -> Dict[str, Tuple[int, int]]:
+        """获取所有模组目录及其info.ini的修改时间"""
+        snapshot = {}
+        try:
+            with os.scandir(self.root_path) as entries:
+                for entry in entries:
+                    if not entry.name.isdigit() or not entry.is_dir():
+                        continue
+                    try:
+                        folder_mtime = entry.stat().st_mtime_ns
+                    except OSError:
+                        continue
+                    try:
+                        ini_mtime = os.stat(os.path.join(entry.path, 'info.ini')).st_mtime_ns
+                    except OSError:
+                        ini_mtime = 0
+                    snapshot[entry.name] = (folder_mtime, ini_mtime)
+        except OSError as e:
+            print(f"轮询模组目录时出错: {e}")
+        return snapshot
+
+    def _poll_loop(self):
+        """轮询模式：比较前后两次快照，找出新增、删除和修改的模组"""
+        previous = self._snapshot()
+        while not self._stop_event.wait(self._poll_interval):
+            current = self._snapshot()
+            changed_ids = {
+                mod_id for mod_id in previous.keys() | current.keys()
+                if previous.get(mod_id) != current.get(mod_id)
+            }
+            previous = current
+            if changed_ids:
+                with self._lock:
+                    self._pending.update(changed_ids)
+                self._flush()
@@ -0,0 +1,185 @@
+# services/remote_mod_details.py
+import os
+import json
+import time
+import threading
+from typing import Dict, Iterable, Optional
+
+from .config_manager import config_manager
+from .mod_manager import mod_manager
+from .steam_web_api import steam_web_api
+
+# 默认缓存有效期（秒）
+DEFAULT_TTL = 6 * 60 * 60
+
+
+class RemoteModDetails:
+    """
+    本地模组的创意工坊详情缓存
+
+    用GetPublishedFileDetails批量获取本地模组的远程标题、更新时间、订阅数和收藏数，
+    每次POST最多100个模组，结果保存在src/data/remote_mod_details.json中。
+    刷新时只请求缓存中没有或已过期的模组，完成后通知监听器。
+    """
+
+    def __init__(self, cache_path: Optional[str] = None, web_api=None):
+        """
+        Args:
+            cache_path (str, optional): 缓存文件路径，默认为src/data/remote_mod_details.json
+            web_api (SteamWebApiClient, optional): Steam Web API客户端，默认使用全局实例
+        """
+        self.cache_path = cache_path or os.path.join(
+            os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            "data",
+            "remote_mod_details.json"
+        )
+        self.web_api = web_api or steam_web_api
+        self._lock = threading.Lock()
+        # 同一时间只进行一次刷新，避免页面重建时重复请求
+        self._refresh_lock = threading.Lock()
+        self._entries: Dict[str, Dict] = self._load()
+        self._listeners = []
+
+    def _load(self) -> Dict[str, Dict]:
+        """读取缓存文件"""
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+            return entries if isinstance(entries, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            print(f"读取模组详情缓存时出错: {e}")
+            return {}
+
+    def _save(self):
+        """先写临时文件再替换，避免留下写了一半的缓存"""
+        with self._lock:
+            entries = dict(self._entries)
+        os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+        temp_path = f"{self.cache_path}.{threading.get_ident()}.tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(entries, f, ensure_ascii=False)
+            os.replace(temp_path, self.cache_path)
+        except Exception as e:
+            print(f"写入模组详情缓存时出错: {e}")
+
+    @staticmethod
+    def get_ttl() -> int:
+        """获取配置的缓存有效期（秒）"""
+        try:
+            return int(config_manager.get("remote_details_ttl", DEFAULT_TTL))
+        except (TypeError, ValueError):
+            return DEFAULT_TTL
+
+    def get(self, mod_id: str) -> Optional[Dict]:
+        """
+        获取模组的创意工坊详情（不论是否过期）
+
+        Args:
+            mod_id (str): 模组ID
+
+        Returns:
+            Optional[Dict]: 包含title、time_updated、subscriptions、favorites、fetched_at的字典，没有缓存时返回None
+        """
+        with self._lock:
+            return self._entries.get(str(mod_id))
+
+    def is_fresh(self, entry: Dict) -> bool:
+        """缓存条目是否仍在有效期内"""
+        return time.time() - entry.get('fetched_at', 0) < self.get_ttl()
+
+    def fetch(self, mod_ids: Iterable[str], force: bool = False) -> Dict[str, Dict]:
+        """
+        批量获取模组详情，只请求缓存中没有或已过期的模组
+
+        Args:
+            mod_ids (Iterable[str]): 模组ID
+            force (bool): 为True时忽略缓存，全部重新请求
+
+        Returns:
+            Dict[str, Dict]: 本次更新的模组ID -> 详情
+        """
+        with self._lock:
+            stale_ids = [str(mod_id) for mod_id in mod_ids
+                         if force or str(mod_id) not in self._entries
+                         or not self.is_fresh(self._entries[str(mod_id)])]
+        if not stale_ids:
+            return {}
+
+        start_time = time.perf_counter()
+        details_by_id = self.web_api.get_published_file_details(stale_ids)
+        fetched_at = time.time()
+        updated = {}
+        for mod_id, details in details_by_id.items():
+            updated[mod_id] = {
+                'title': details.get('title') or '',
+                'time_updated': int(details.get('time_updated', 0) or 0),
+                'subscriptions': int(details.get('subscriptions', 0) or 0),
+                'favorites': int(details.get('favorited', 0) or 0),
+                'fetched_at': fetched_at,
+            }
+        print(f"获取模组详情: 请求 {len(stale_ids)} 个，成功 {len(updated)} 个，"
+              f"耗时 {time.perf_counter() - start_time:.2f}s")
+        if not updated:
+            return {}
+
+        with self._lock:
+            self._entries.update(updated)
+        self._save()
+        self._notify_listeners(list(updated))
+        return updated
+
+    def refresh_local_mods(self, force: bool = False) -> Dict[str, Dict]:
+        """
+        为全部本地模组获取详情（阻塞调用，应在后台线程中执行）
+
+        Args:
+            force (bool): 为True时忽略缓存，全部重新请求
+
+        Returns:
+            Dict[str, Dict]: 本次更新的模组ID -> 详情
+        """
+        if not self._refresh_lock.acquire(blocking=False):
+            return {}
+        try:
+            mod_ids = [mod_info['id'] for mod_info in mod_manager.get_downloaded_mods()]
+            return self.fetch(mod_ids, force)
+        except Exception as e:
+            print(f"刷新模组详情时出错: {e}")
+            return {}
+        finally:
+            self._refresh_lock.release()
+
+    def add_listener(self, listener):
+        """
+        添加详情更新监听器
+
+        Args:
+            listener (callable): 监听器函数，参数为本次更新的模组ID列表
+        """
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener):
+        """
+        移除详情更新监听器
+
+        Args:
+            listener (callable): 要移除的监听器函数
+        """
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _notify_listeners(self, mod_ids):
+        """通知所有监听器"""
+        for listener in list(self._listeners):
+            try:
+                listener(mod_ids)
+            except Exception as e:
+                print(f"通知模组详情监听器时出错: {e}")
+
+
+# 创建全局模组详情缓存实例
+remote_mod_details = RemoteModDetails()
@@ -0,0 +1,99 @@
+# services/search_pipeline.py
+import time
+import threading
+from typing import Any, Callable, Dict, Optional
+
+
+class DebouncedSearch:
+    """
+    防抖搜索管线
+
+    输入停止一段时间后才执行搜索；新的查询会取消尚未执行的旧查询，
+    已经执行但被后续查询取代的结果也会被丢弃，只有最后一次查询的结果会回调给页面。
+    """
+
+    def __init__(self, search_func: Callable[[str], Any], on_result: Callable[[str, Any], None],
+                 delay: float = 0.3):
+        """
+        Args:
+            search_func (callable): 搜索函数，参数为搜索词，返回搜索结果
+            on_result (callable): 结果回调，参数为 (搜索词, 搜索结果)
+            delay (float): 防抖延迟（秒）
+        """
+        self._search_func = search_func
+        self._on_result = on_result
+        self._delay = delay
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        # 每次提交查询时递增，执行完成时据此判断结果是否已过期
+        self._sequence = 0
+        self._stats = {
+            'completed': 0,
+            'superseded': 0,
+            'last_ms': 0.0,
+            'total_ms': 0.0,
+            'max_ms': 0.0
+        }
+
+    def submit(self, query: str):
+        """
+        提交查询，在防抖延迟后执行
+
+        Args:
+            query (str): 搜索词
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._stats['superseded'] += 1
+            self._sequence += 1
+            self._timer = threading.Timer(self._delay, self._run, args=(query, self._sequence))
+            self._timer.daemon = True
+            self._timer.start()
+
+    def cancel(self):
+        """取消尚未返回的查询"""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._sequence += 1
+
+    def _run(self, query: str, sequence: int):
+        """执行查询，结果过期时丢弃"""
+        with self._lock:
+            if sequence != self._sequence:
+                return
+            self._timer = None
+
+        start_time = time.perf_counter()
+        try:
+            result = self._search_func(query)
+        except Exception as e:
+            print(f"搜索 \"{query}\" 时出错: {e}")
+            return
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+
+        with self._lock:
+            if sequence != self._sequence:
+                self._stats['superseded'] += 1
+                return
+            self._stats['completed'] += 1
+            self._stats['last_ms'] = elapsed_ms
+            self._stats['total_ms'] += elapsed_ms
+            self._stats['max_ms'] = max(self._stats['max_ms'], elapsed_ms)
+
+        print(f"搜索 \"{query}\" 耗时 {elapsed_ms:.1f} ms")
+        self._on_result(query, result)
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        获取搜索耗时统计
+
+        Returns:
+            Dict[str, float]: 完成次数、被取代次数、最近/平均/最大耗时（毫秒）
+        """
+        with self._lock:
+            stats = dict(self._stats)
+        stats['avg_ms'] = stats['total_ms'] / stats['completed'] if stats['completed'] else 0.0
+        return stats
@@ -0,0 +1,129 @@
+# services/size_accountant.py
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+
+def format_size(total_size: int) -> str:
+    """
+    将字节数格式化为大小字符串
+
+    Args:
+        total_size (int): 字节数
+
+    Returns:
+        str: 格式化的大小字符串
+    """
+    if total_size < 1024:
+        return f"{total_size} B"
+    elif total_size < 1024 * 1024:
+        return f"{total_size // 1024} KB"
+    elif total_size < 1024 * 1024 * 1024:
+        return f"{total_size // (1024 * 1024)} MB"
+    else:
+        return f"{total_size // (1024 * 1024 * 1024)} GB"
+
+
+class DirectorySize:
+    """目录大小结果，保存原始字节数，格式化字符串在首次访问时生成"""
+
+    __slots__ = ('bytes', '_formatted')
+
+    def __init__(self, size_bytes: int):
+        self.bytes = size_bytes
+        self._formatted: Optional[str] = None
+
+    @property
+    def formatted(self) -> str:
+        """格式化的大小字符串"""
+        if self._formatted is None:
+            self._formatted = format_size(self.bytes)
+        return self._formatted
+
+    def __str__(self):
+        return self.formatted
+
+
+class DirectorySizeAccountant:
+    """
+    目录大小统计器
+
+    按目录缓存直属文件的总大小和子目录列表，并记录目录的修改时间。
+    再次统计时只对修改时间发生变化的目录重新用os.scandir遍历，
+    未变化的目录只需一次stat。注意：原地覆盖写入文件不会改变目录修改时间，
+    这种情况需要调用invalidate强制重新统计。
+
+    目录监视器线程和计算大小的线程会同时访问缓存，所有读写都在锁内进行；
+    遍历目录本身不持有锁。
+    """
+
+    def __init__(self):
+        # 目录路径 -> (修改时间, 直属文件总大小, 子目录路径元组)
+        self._entries: Dict[str, Tuple[int, int, Tuple[str, ...]]] = {}
+        self._lock = threading.Lock()
+
+    def get_size(self, path: str) -> DirectorySize:
+        """
+        获取目录大小
+
+        Args:
+            path (str): 目录路径
+
+        Returns:
+            DirectorySize: 目录大小
+        """
+        try:
+            return DirectorySize(self._measure(path))
+        except OSError:
+            self.invalidate(path)
+            return DirectorySize(0)
+
+    def invalidate(self, path: str):
+        """移除目录及其所有子目录的缓存"""
+        prefix = os.path.join(path, '')
+        with self._lock:
+            for cached_path in [cached_path for cached_path in self._entries
+                                if cached_path == path or cached_path.startswith(prefix)]:
+                self._entries.pop(cached_path, None)
+
+    def _measure(self, path: str) -> int:
+        """统计目录总大小，未变化的目录直接使用缓存的直属文件大小"""
+        mtime = os.stat(path).st_mtime_ns
+        with self._lock:
+            entry = self._entries.get(path)
+
+        if entry is not None and entry[0] == mtime:
+            files_size, subdirs = entry[1], entry[2]
+        else:
+            files_size, subdirs = self._scan(path)
+            if entry is not None:
+                # 清理已被删除的子目录缓存
+                for removed in set(entry[2]) - set(subdirs):
+                    self.invalidate(removed)
+            with self._lock:
+                self._entries[path] = (mtime, files_size, subdirs)
+
+        total_size = files_size
+        for subdir in subdirs:
+            try:
+                total_size += self._measure(subdir)
+            except OSError:
+                self.invalidate(subdir)
+        return total_size
+
+    @staticmethod
+    def _scan(path: str) -> Tuple[int, Tuple[str, ...]]:
+        """遍历单个目录，返回直属文件总大小和子目录列表"""
+        files_size = 0
+        subdirs = []
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        # Windows下scandir的stat结果来自目录枚举本身，无需额外系统调用
+                        files_size += entry.stat(follow_symlinks=False).st_size
+                except OSError:
+                    continue
+        return files_size, tuple(subdirs)
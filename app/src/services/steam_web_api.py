@@ -0,0 +1,245 @@
+# services/steam_web_api.py
+import math
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import requests
+
+from .config_manager import config_manager
+from .http_session import get_session
+from .lru_cache import LRUCache
+
+# Steam Web API默认地址，可在配置中改为本地的模拟服务器
+DEFAULT_API_BASE_URL = "https://api.steampowered.com"
+
+# GetPublishedFileDetails单次请求的最大物品数
+DETAILS_BATCH_SIZE = 100
+
+# GetPlayerSummaries单次请求的最大SteamID数
+PLAYER_SUMMARIES_BATCH_SIZE = 100
+
+# 作者昵称的缓存有效期（秒）
+PERSONA_NAME_TTL = 24 * 60 * 60
+
+# 尚未获取到作者昵称时显示的名称
+UNKNOWN_AUTHOR = "Steam用户"
+
+# 排序方式 -> EPublishedFileQueryType
+QUERY_TYPES = {
+    'most_popular': 9,   # k_PublishedFileQueryType_RankedByTotalUniqueSubscriptions
+    'top_rated': 0,      # k_PublishedFileQueryType_RankedByVote
+    'newest': 1,         # k_PublishedFileQueryType_RankedByPublicationDate
+    'last_updated': 21,  # k_PublishedFileQueryType_RankedByLastUpdatedDate
+}
+
+
+class SteamWebApiClient:
+    """
+    Steam Web API客户端
+
+    QueryFiles按排序和搜索词分页列出创意工坊物品（需要API密钥），
+    GetPublishedFileDetails用一次POST获取多个物品的详细信息（无需密钥），
+    API只返回作者的SteamID，昵称用GetPlayerSummaries批量获取并缓存。
+    这里生成请求参数并转换响应；创意工坊页面通过异步引擎发出请求，
+    后台线程中批量获取详情时使用get_published_file_details。
+    返回的物品信息与浏览页解析结果的字段一致，但包含订阅数、收藏数和评分。
+    """
+
+    def __init__(self, base_url: Optional[str] = None, api_key: Optional[str] = None):
+        """
+        Args:
+            base_url (str, optional): API地址，默认读取配置项steam_api_base_url
+            api_key (str, optional): API密钥，默认读取配置项steam_web_api_key
+        """
+        self._base_url = base_url
+        self._api_key = api_key
+        self.session = get_session()
+        # SteamID -> 作者昵称
+        self.persona_names = LRUCache(max_entries=4096, max_bytes=1024 * 1024, ttl=PERSONA_NAME_TTL)
+
+    @property
+    def base_url(self) -> str:
+        return (self._base_url or config_manager.get("steam_api_base_url") or DEFAULT_API_BASE_URL).rstrip('/')
+
+    @property
+    def api_key(self) -> str:
+        return self._api_key or config_manager.get("steam_web_api_key") or ""
+
+    def has_api_key(self) -> bool:
+        """是否配置了API密钥（QueryFiles需要）"""
+        return bool(self.api_key)
+
+    @property
+    def query_files_url(self) -> str:
+        return f"{self.base_url}/IPublishedFileService/QueryFiles/v1/"
+
+    @property
+    def file_details_url(self) -> str:
+        return f"{self.base_url}/ISteamRemoteStorage/GetPublishedFileDetails/v1/"
+
+    @property
+    def player_summaries_url(self) -> str:
+        return f"{self.base_url}/ISteamUser/GetPlayerSummaries/v2/"
+
+    def query_files_params(self, app_id: str, sort_by: str = 'most_popular', search_term: str = '',
+                           page: int = 1, per_page: int = 30) -> Dict:
+        """
+        生成QueryFiles的请求参数
+
+        Args:
+            app_id (str): 游戏ID
+            sort_by (str): 排序方式 ('most_popular', 'top_rated', 'newest', 'last_updated')
+            search_term (str): 搜索关键词
+            page (int): 页码
+            per_page (int): 每页数量
+
+        Returns:
+            Dict: 请求参数
+        """
+        if sort_by not in QUERY_TYPES:
+            raise ValueError(f"不支持的排序方式: {sort_by}. 支持的方式: {list(QUERY_TYPES.keys())}")
+
+        params = {
+            'key': self.api_key,
+            'appid': app_id,
+            'query_type': QUERY_TYPES[sort_by],
+            'page': page,
+            'numperpage': per_page,
+            'return_vote_data': 'true',
+            'return_short_description': 'true',
+            'return_previews': 'false',
+        }
+        if search_term:
+            params['search_text'] = search_term
+        return params
+
+    def build_query_result(self, data: Dict, app_id: str, page: int, per_page: int = 30) -> Dict:
+        """将QueryFiles的响应转换为与浏览页解析结果相同格式的字典"""
+        items = [self.to_item(details, app_id) for details in data.get('publishedfiledetails', [])
+                 if details.get('result', 1) == 1]
+        return {
+            'items': items,
+            'current_page': page,
+            'total_pages': max(1, math.ceil(data.get('total', 0) / per_page))
+        }
+
+    def get_published_file_details(self, item_ids: Iterable[str]) -> Dict[str, Dict]:
+        """
+        批量获取物品详细信息，每次POST最多包含100个物品
+
+        Args:
+            item_ids (Iterable[str]): 物品ID
+
+        Returns:
+            Dict[str, Dict]: 物品ID -> 原始详细信息，获取失败或不存在的物品不包含在内
+        """
+        details_by_id = {}
+        for form in self.file_details_forms(item_ids):
+            try:
+                response = self.session.post(self.file_details_url, data=form, timeout=15)
+                response.raise_for_status()
+                data = response.json().get('response', {})
+            except (requests.RequestException, ValueError) as e:
+                print(f"获取创意工坊物品详情时出错: {e}")
+                continue
+            self.collect_details(data, details_by_id)
+        return details_by_id
+
+    @staticmethod
+    def file_details_forms(item_ids: Iterable[str]) -> List[Dict]:
+        """将物品ID去重后按每批100个生成GetPublishedFileDetails的表单"""
+        item_ids = list(dict.fromkeys(str(item_id) for item_id in item_ids))
+        forms = []
+        for start in range(0, len(item_ids), DETAILS_BATCH_SIZE):
+            batch = item_ids[start:start + DETAILS_BATCH_SIZE]
+            form = {'itemcount': len(batch)}
+            for index, item_id in enumerate(batch):
+                form[f'publishedfileids[{index}]'] = item_id
+            forms.append(form)
+        return forms
+
+    @staticmethod
+    def collect_details(data: Dict, details_by_id: Dict[str, Dict]):
+        """从GetPublishedFileDetails的响应中收集存在的物品"""
+        for details in data.get('publishedfiledetails', []):
+            if details.get('result') == 1:
+                details_by_id[str(details.get('publishedfileid'))] = details
+
+    def player_summaries_params(self, items: Iterable[Dict]) -> List[Dict]:
+        """为昵称尚未缓存的作者按每批100个生成GetPlayerSummaries的请求参数"""
+        steam_ids = [steam_id for steam_id in dict.fromkeys(item.get('author_id') for item in items)
+                     if steam_id and steam_id not in self.persona_names]
+        return [{'key': self.api_key, 'steamids': ','.join(steam_ids[start:start + PLAYER_SUMMARIES_BATCH_SIZE])}
+                for start in range(0, len(steam_ids), PLAYER_SUMMARIES_BATCH_SIZE)]
+
+    def collect_persona_names(self, data: Dict):
+        """从GetPlayerSummaries的响应中缓存作者昵称"""
+        for player in data.get('players', []):
+            if player.get('steamid') and player.get('personaname'):
+                self.persona_names.put(str(player['steamid']), player['personaname'])
+
+    def apply_persona_names(self, items: List[Dict]) -> List[Dict]:
+        """用缓存的昵称替换物品的作者名（原地修改并返回同一个列表）"""
+        for item in items:
+            name = self.persona_names.get(item.get('author_id'))
+            if name:
+                item['author'] = name
+        return items
+
+    @staticmethod
+    def _vote_summary(details: Dict) -> Tuple[float, int]:
+        """从vote_data中计算五分制评分和投票数"""
+        vote_data = details.get('vote_data') or {}
+        votes = int(vote_data.get('votes_up', 0)) + int(vote_data.get('votes_down', 0))
+        return round(float(vote_data.get('score', 0.0)) * 5, 1), votes
+
+    @classmethod
+    def to_item(cls, details: Dict, app_id: Optional[str] = None) -> Dict:
+        """
+        将API返回的详细信息转换为页面使用的物品信息
+
+        Args:
+            details (Dict): QueryFiles或GetPublishedFileDetails返回的单个物品
+            app_id (str, optional): 游戏ID，用于生成作者的创意工坊链接
+
+        Returns:
+            Dict: 物品信息
+        """
+        item_id = str(details.get('publishedfileid', ''))
+        creator = str(details.get('creator', ''))
+        app_id = app_id or details.get('consumer_app_id') or details.get('consumer_appid') or ''
+        rating, rating_count = cls._vote_summary(details)
+        name = details.get('title') or '未知名称'
+        return {
+            'id': item_id,
+            'name': name,
+            'title': name,
+            'url': f"https://steamcommunity.com/sharedfiles/filedetails/?id={item_id}",
+            'preview_url': details.get('preview_url', ''),
+            # 昵称需要另外请求，先显示占位名称
+            'author': UNKNOWN_AUTHOR,
+            'author_id': creator,
+            'author_link': f"https://steamcommunity.com/profiles/{creator}/myworkshopfiles/?appid={app_id}" if creator else '',
+            'rating': rating,
+            'rating_count': rating_count,
+            'subscriptions': int(details.get('subscriptions', 0) or 0),
+            'favorites': int(details.get('favorited', 0) or 0),
+            'description': details.get('short_description') or details.get('file_description')
+                           or details.get('description') or '暂无描述',
+            'time_updated': int(details.get('time_updated', 0) or 0),
+        }
+
+    @staticmethod
+    def apply_details(items: List[Dict], details_by_id: Dict[str, Dict]) -> List[Dict]:
+        """将批量获取的详细信息写入物品信息（原地修改并返回同一个列表）"""
+        for item in items:
+            details = details_by_id.get(item.get('id'))
+            if details is None:
+                continue
+            item['subscriptions'] = int(details.get('subscriptions', 0) or 0)
+            item['favorites'] = int(details.get('favorited', 0) or 0)
+            item['time_updated'] = int(details.get('time_updated', 0) or 0)
+        return items
+
+
+# 创建全局Steam Web API客户端实例
+steam_web_api = SteamWebApiClient()
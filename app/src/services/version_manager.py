@@ -5,6 +5,8 @@ import logging
 from typing import Optional, Dict, Any
 from urllib.parse import urlparse
 
+from .http_session import get_session
+
 logger = logging.getLogger(__name__)
 
 
@@ -72,7 +74,7 @@ class VersionManager:
                 'User-Agent': 'Duckov-Mod-Manager'
             }
             
-            response = requests.get(self.github_api_url, headers=headers, timeout=10)
+            response = get_session().get(self.github_api_url, headers=headers, timeout=10)
             response.raise_for_status()
             
             release_data = response.json()
@@ -0,0 +1,164 @@
+# services/workshop_cache.py
+import os
+import json
+import time
+import hashlib
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from .config_manager import config_manager
+
+# 默认缓存有效期（秒）
+DEFAULT_TTL = 600
+
+# 过期条目仍用于条件请求和离线时的回退，超过此时间（秒）后才删除
+DEFAULT_MAX_AGE = 7 * 24 * 60 * 60
+
+# 最多保留的缓存文件数
+DEFAULT_MAX_ENTRIES = 256
+
+
+class WorkshopResponseCache:
+    """
+    创意工坊浏览页的磁盘缓存
+
+    以 (app_id, 排序方式, 搜索词, 页码, 数据来源) 为键保存解析后的物品列表，每个键一个JSON文件，
+    同时记录响应的ETag和Last-Modified。有效期内直接返回缓存；过期后由调用方带上
+    条件请求头重新验证，服务器返回304时只刷新缓存时间，不再下载和解析页面。
+
+    条目每次都从文件读取，内存中的热点页面由预加载缓存（services/lru_cache.py）负责。
+    启动时和每次写入后清理超过max_age的文件，并只保留最近写入的max_entries个文件。
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_age: int = DEFAULT_MAX_AGE,
+                 max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Args:
+            cache_dir (str, optional): 缓存目录，默认为src/data/workshop_cache
+            max_age (int): 缓存文件最长保留时间（秒）
+            max_entries (int): 最多保留的缓存文件数
+        """
+        self.cache_dir = cache_dir or os.path.join(
+            os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            "data",
+            "workshop_cache"
+        )
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.max_age = max_age
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self.prune()
+
+    @staticmethod
+    def get_ttl() -> int:
+        """获取配置的缓存有效期（秒）"""
+        try:
+            return int(config_manager.get("workshop_cache_ttl", DEFAULT_TTL))
+        except (TypeError, ValueError):
+            return DEFAULT_TTL
+
+    def _file_path(self, key: Tuple) -> str:
+        """根据缓存键生成文件路径"""
+        digest = hashlib.sha1(json.dumps(list(key), ensure_ascii=False).encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.json")
+
+    def get(self, key: Tuple) -> Optional[Dict[str, Any]]:
+        """
+        获取缓存条目（不论是否过期）
+
+        Args:
+            key (tuple): 缓存键
+
+        Returns:
+            Optional[Dict[str, Any]]: 包含data、stored_at、etag、last_modified的条目，不存在时返回None
+        """
+        try:
+            with open(self._file_path(key), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"读取创意工坊缓存时出错: {e}")
+            return None
+
+    def is_fresh(self, entry: Dict[str, Any]) -> bool:
+        """缓存条目是否仍在有效期内"""
+        return time.time() - entry.get('stored_at', 0) < self.get_ttl()
+
+    def put(self, key: Tuple, data: Any, etag: Optional[str] = None, last_modified: Optional[str] = None):
+        """
+        保存缓存条目
+
+        Args:
+            key (tuple): 缓存键
+            data: 解析后的数据（需要可以序列化为JSON）
+            etag (str, optional): 响应的ETag
+            last_modified (str, optional): 响应的Last-Modified
+        """
+        entry = {
+            'key': list(key),
+            'stored_at': time.time(),
+            'etag': etag,
+            'last_modified': last_modified,
+            'data': data
+        }
+        self._write(self._file_path(key), entry)
+        self.prune()
+
+    def touch(self, key: Tuple):
+        """服务器确认内容未变化（304）时刷新缓存时间"""
+        entry = self.get(key)
+        if entry is None:
+            return
+        entry = dict(entry, stored_at=time.time())
+        self._write(self._file_path(key), entry)
+
+    def _write(self, path: str, entry: Dict[str, Any]):
+        """先写临时文件再替换，避免留下写了一半的缓存"""
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(temp_path, path)
+        except Exception as e:
+            print(f"写入创意工坊缓存时出错: {e}")
+
+    def prune(self):
+        """删除超过最长保留时间的缓存文件，文件数超过上限时删除最早写入的文件"""
+        with self._lock:
+            files = []
+            try:
+                with os.scandir(self.cache_dir) as entries:
+                    for entry in entries:
+                        if entry.name.endswith('.json'):
+                            try:
+                                files.append((entry.stat().st_mtime, entry.path))
+                            except OSError:
+                                continue
+            except OSError as e:
+                print(f"清理创意工坊缓存时出错: {e}")
+                return
+
+            files.sort(reverse=True)
+            expire_before = time.time() - self.max_age
+            removed = [path for index, (mtime, path) in enumerate(files)
+                       if mtime < expire_before or index >= self.max_entries]
+            for path in removed:
+                try:
+                    os.remove(path)
+                except OSError as e:
+                    print(f"删除创意工坊缓存时出错: {e}")
+
+    def clear(self):
+        """清空全部缓存"""
+        with self._lock:
+            for name in os.listdir(self.cache_dir):
+                if name.endswith('.json'):
+                    try:
+                        os.remove(os.path.join(self.cache_dir, name))
+                    except OSError as e:
+                        print(f"删除创意工坊缓存时出错: {e}")
+
+
+# 创建全局创意工坊缓存实例
+workshop_cache = WorkshopResponseCache()
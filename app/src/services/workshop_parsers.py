@@ -0,0 +1,207 @@
+# services/workshop_parsers.py
+import re
+from typing import Callable, Dict, List, Optional, Tuple
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    import lxml.html
+except ImportError:
+    lxml = None
+
+# 分页链接中的页码
+_PAGE_PATTERN = re.compile(r'&p=(\d+)')
+
+
+def _build_item(item_id: str, url: str, name: str, preview_url: str, author: str,
+                author_link: str, description: str) -> Dict:
+    """组装物品信息（评分、订阅数等在浏览页上不可见，固定为0）"""
+    return {
+        'id': item_id,
+        'name': name,
+        'title': name,  # 添加title字段以匹配页面使用
+        'url': url,
+        'preview_url': preview_url,
+        'author': author,
+        'author_link': author_link,
+        'rating': 0.0,
+        'rating_count': 0,
+        'subscriptions': 0,
+        'favorites': 0,
+        'description': description  # 添加描述信息
+    }
+
+
+def _max_page(hrefs) -> int:
+    """从分页链接中提取最大页码"""
+    max_page = 1
+    for href in hrefs:
+        page_match = _PAGE_PATTERN.search(href or '')
+        if page_match:
+            max_page = max(max_page, int(page_match.group(1)))
+    return max_page
+
+
+def parse_with_soup(html: str) -> Tuple[List[Dict], int]:
+    """
+    BeautifulSoup解析
+
+    用SoupStrainer只构建物品和分页控件节点，其余标记在解析时直接丢弃。
+    安装了lxml时用lxml作为底层解析器，否则使用html.parser。
+    """
+    strainer = SoupStrainer('div', class_=['workshopItem', 'workshopBrowsePagingControls'])
+    soup = BeautifulSoup(html, 'lxml' if lxml is not None else 'html.parser', parse_only=strainer)
+
+    items = []
+    for item_element in soup.find_all('div', class_='workshopItem'):
+        try:
+            # 提取物品ID和URL
+            link_element = item_element.find('a', class_='ugc')
+            if not link_element:
+                continue
+
+            title_element = item_element.find('div', class_='workshopItemTitle')
+            image_element = item_element.find('img', class_='workshopItemPreviewImage')
+            description_element = item_element.find('div', class_='workshopItemDescription')
+
+            # 提取作者信息
+            author = ''
+            author_link = ''
+            author_element = item_element.find('div', class_='workshopItemAuthorName')
+            author_link_element = author_element.find('a') if author_element else None
+            if author_link_element:
+                author = author_link_element.get_text(strip=True)
+                author_link = author_link_element.get('href', '')
+
+            items.append(_build_item(
+                link_element.get('data-publishedfileid', ''),
+                link_element.get('href', ''),
+                title_element.get_text(strip=True) if title_element else '未知名称',
+                image_element.get('src', '') if image_element else '',
+                author,
+                author_link,
+                description_element.get_text(strip=True) if description_element else '暂无描述'
+            ))
+        except Exception as e:
+            print(f"解析物品时出错: {e}")
+
+    total_pages = 1
+    pagination_controls = soup.find('div', class_='workshopBrowsePagingControls')
+    if pagination_controls:
+        total_pages = _max_page(link.get('href', '') for link in pagination_controls.find_all('a', class_='pagelink'))
+    return items, total_pages
+
+
+def parse_with_selectolax(html: str) -> Tuple[List[Dict], int]:
+    """selectolax（Lexbor）解析，用CSS选择器直接定位所需节点"""
+    tree = LexborHTMLParser(html)
+
+    def text_of(node) -> str:
+        # 与BeautifulSoup的get_text(strip=True)一致：各文本片段去除空白后直接拼接
+        return node.text(deep=True, separator='', strip=True) if node is not None else ''
+
+    items = []
+    for item_element in tree.css('div.workshopItem'):
+        try:
+            link_element = item_element.css_first('a.ugc')
+            if link_element is None:
+                continue
+
+            title_element = item_element.css_first('div.workshopItemTitle')
+            image_element = item_element.css_first('img.workshopItemPreviewImage')
+            description_element = item_element.css_first('div.workshopItemDescription')
+            author_link_element = item_element.css_first('div.workshopItemAuthorName a')
+
+            items.append(_build_item(
+                link_element.attributes.get('data-publishedfileid') or '',
+                link_element.attributes.get('href') or '',
+                text_of(title_element) if title_element is not None else '未知名称',
+                (image_element.attributes.get('src') or '') if image_element is not None else '',
+                text_of(author_link_element),
+                (author_link_element.attributes.get('href') or '') if author_link_element is not None else '',
+                text_of(description_element) if description_element is not None else '暂无描述'
+            ))
+        except Exception as e:
+            print(f"解析物品时出错: {e}")
+
+    total_pages = _max_page(link.attributes.get('href') for link in
+                            tree.css('div.workshopBrowsePagingControls a.pagelink'))
+    return items, total_pages
+
+
+def _class_xpath(tag: str, class_name: str) -> str:
+    """生成按class匹配元素的XPath（class属性可能包含多个类名）"""
+    return f"{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')]"
+
+
+def parse_with_lxml(html: str) -> Tuple[List[Dict], int]:
+    """lxml解析，用XPath定位所需节点"""
+    tree = lxml.html.fromstring(html)
+
+    def first(element, path):
+        found = element.xpath(path)
+        return found[0] if found else None
+
+    def text_of(element) -> str:
+        # 与BeautifulSoup的get_text(strip=True)一致：各文本片段去除空白后直接拼接
+        return ''.join(text.strip() for text in element.itertext()) if element is not None else ''
+
+    items = []
+    for item_element in tree.xpath('//' + _class_xpath('div', 'workshopItem')):
+        try:
+            link_element = first(item_element, './/' + _class_xpath('a', 'ugc'))
+            if link_element is None:
+                continue
+
+            title_element = first(item_element, './/' + _class_xpath('div', 'workshopItemTitle'))
+            image_element = first(item_element, './/' + _class_xpath('img', 'workshopItemPreviewImage'))
+            description_element = first(item_element, './/' + _class_xpath('div', 'workshopItemDescription'))
+            author_link_element = first(item_element, './/' + _class_xpath('div', 'workshopItemAuthorName') + '//a')
+
+            items.append(_build_item(
+                link_element.get('data-publishedfileid', ''),
+                link_element.get('href', ''),
+                text_of(title_element) if title_element is not None else '未知名称',
+                image_element.get('src', '') if image_element is not None else '',
+                text_of(author_link_element),
+                author_link_element.get('href', '') if author_link_element is not None else '',
+                text_of(description_element) if description_element is not None else '暂无描述'
+            ))
+        except Exception as e:
+            print(f"解析物品时出错: {e}")
+
+    paging_links = tree.xpath('//' + _class_xpath('div', 'workshopBrowsePagingControls') +
+                              '//' + _class_xpath('a', 'pagelink'))
+    return items, _max_page(link.get('href', '') for link in paging_links)
+
+
+# 可用的解析后端，按速度从快到慢排列
+PARSERS: Dict[str, Callable[[str], Tuple[List[Dict], int]]] = {}
+if LexborHTMLParser is not None:
+    PARSERS['selectolax'] = parse_with_selectolax
+if lxml is not None:
+    PARSERS['lxml'] = parse_with_lxml
+PARSERS['soup'] = parse_with_soup
+
+
+def get_parser(backend: Optional[str] = None) -> Callable[[str], Tuple[List[Dict], int]]:
+    """
+    获取浏览页解析函数
+
+    Args:
+        backend (str, optional): selectolax、lxml或soup；为空或auto时选择已安装的最快后端
+
+    Returns:
+        callable: 解析函数，参数为HTML文本，返回 (物品列表, 总页数)
+    """
+    if backend and backend != 'auto':
+        parser = PARSERS.get(backend)
+        if parser is not None:
+            return parser
+        print(f"解析后端 {backend} 不可用，改用自动选择")
+    return next(iter(PARSERS.values()))
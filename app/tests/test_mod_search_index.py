@@ -0,0 +1,80 @@
+# tests/test_mod_search_index.py
+import importlib.util
+import os
+
+import pytest
+
+# 按文件路径加载，避免导入services包时依赖flet
+_MODULE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                            "src", "services", "mod_search_index.py")
+_spec = importlib.util.spec_from_file_location("mod_search_index", _MODULE_PATH)
+mod_search_index = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(mod_search_index)
+
+MODS = [
+    {'id': '1', 'name': 'TexturePack', 'description': 'HD textures'},
+    {'id': '2', 'name': 'Better-Guns', 'description': 'More weapons'},
+    {'id': '3', 'name': 'Русский перевод', 'description': 'Перевод интерфейса'},
+    {'id': '4', 'name': 'カタカナ テスト', 'description': 'ひらがなの説明'},
+    {'id': '5', 'name': '한국어 번역', 'description': '인터페이스'},
+    {'id': '6', 'name': '更好的背包', 'description': '扩展背包容量'},
+    {'id': '7', 'name': 'Package Manager', 'description': ''},
+]
+
+
+@pytest.fixture
+def index():
+    search_index = mod_search_index.ModSearchIndex()
+    search_index.build(MODS)
+    return search_index
+
+
+@pytest.mark.parametrize("query, expected", [
+    ("pack", ['1', '7']),         # 词中间的子串
+    ("PACK", ['1', '7']),         # 不区分大小写
+    ("ture", ['1']),
+    ("guns", ['2']),
+    ("weapon", ['2']),
+])
+def test_infix_matches(index, query, expected):
+    assert index.search(query) == expected
+
+
+@pytest.mark.parametrize("query, expected", [
+    ("перев", ['3']),             # 西里尔文
+    ("русск", ['3']),
+    ("カタカナ", ['4']),           # 片假名
+    ("ひらがな", ['4']),           # 平假名
+    ("번역", ['5']),               # 韩文
+    ("한", ['5']),
+    ("背包", ['6']),               # 汉字
+])
+def test_non_latin_queries(index, query, expected):
+    assert index.search(query) == expected
+
+
+@pytest.mark.skipif(mod_search_index.lazy_pinyin is None, reason="未安装pypinyin")
+@pytest.mark.parametrize("query, expected", [
+    ("genghao", ['6']),           # 从标题开头的全拼
+    ("beibao", ['6']),            # 从标题中间开始的全拼
+    ("haode", ['6']),
+    ("bei", ['6']),               # 音节前缀
+    ("ghdbb", ['6']),             # 首字母缩写
+    ("bb", ['6']),                # 从中间开始的首字母
+    ("rongliang", ['6']),         # 描述中的拼音
+])
+def test_pinyin_queries(index, query, expected):
+    assert index.search(query) == expected
+
+
+def test_punctuation_query_falls_back_to_substring(index):
+    assert index.search("-") == ['2']
+
+
+def test_query_across_word_boundary_falls_back_to_substring(index):
+    assert index.search("package man") == ['7']
+
+
+def test_no_match(index):
+    assert index.search("nothing here") == []
+    assert index.search("   ") == []
@@ -0,0 +1,162 @@
+# tests/test_steam_web_api.py
+import asyncio
+import importlib
+import importlib.util
+import os
+import sys
+
+import pytest
+
+_APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_SERVICES_DIR = os.path.join(_APP_DIR, "src", "services")
+sys.path.insert(0, os.path.join(os.path.dirname(_APP_DIR), "test_steamapi"))
+
+import fake_steam_api  # noqa: E402
+
+ITEM_COUNT = 250
+
+
+@pytest.fixture(scope="module")
+def services(tmp_path_factory):
+    """
+    只注册services包而不执行其__init__，避免导入页面依赖的flet
+
+    配置管理器会在当前目录创建app_config.json，导入时切换到临时目录。
+    """
+    if "services" not in sys.modules:
+        spec = importlib.util.spec_from_file_location(
+            "services", os.path.join(_SERVICES_DIR, "__init__.py"),
+            submodule_search_locations=[_SERVICES_DIR])
+        sys.modules["services"] = importlib.util.module_from_spec(spec)
+    cwd = os.getcwd()
+    os.chdir(tmp_path_factory.mktemp("config"))
+    try:
+        steam_web_api = importlib.import_module("services.steam_web_api")
+        async_workshop_client = importlib.import_module("services.async_workshop_client")
+        steam_workshop_service = importlib.import_module("services.steam_workshop_service")
+        workshop_cache = importlib.import_module("services.workshop_cache")
+    finally:
+        os.chdir(cwd)
+    return steam_web_api, async_workshop_client, steam_workshop_service, workshop_cache
+
+
+@pytest.fixture(scope="module")
+def api_url():
+    server, url = fake_steam_api.start_fake_server(0, ITEM_COUNT)
+    yield url
+    server.shutdown()
+
+
+@pytest.fixture
+def client(services, api_url, tmp_path):
+    steam_web_api, async_workshop_client, steam_workshop_service, workshop_cache = services
+    web_api = steam_web_api.SteamWebApiClient(base_url=api_url, api_key=fake_steam_api.FAKE_API_KEY)
+    service = steam_workshop_service.SteamWorkshopService(
+        cache=workshop_cache.WorkshopResponseCache(str(tmp_path)), web_api=web_api)
+    return async_workshop_client.AsyncWorkshopClient(service, retries=0)
+
+
+def run(client, coro):
+    """在新的事件循环中执行协程，结束后关闭连接池"""
+    async def main():
+        try:
+            return await coro
+        finally:
+            await client.aclose()
+    return asyncio.run(main())
+
+
+def raw_items():
+    return {item['publishedfileid']: item for item in fake_steam_api.generate_items(ITEM_COUNT)}
+
+
+def test_query_files_paging(client):
+    first = run(client, client.query_files(fake_steam_api.APP_ID, 'most_popular', '', 1))
+    last = run(client, client.query_files(fake_steam_api.APP_ID, 'most_popular', '', 9))
+    assert first['total_pages'] == 9
+    assert first['current_page'] == 1
+    assert len(first['items']) == 30
+    assert last['current_page'] == 9
+    assert len(last['items']) == ITEM_COUNT - 8 * 30
+    assert not {item['id'] for item in first['items']} & {item['id'] for item in last['items']}
+
+
+def test_query_files_search(client):
+    result = run(client, client.query_files(fake_steam_api.APP_ID, 'newest', '模拟模组 12 ', 1))
+    assert [item['id'] for item in result['items']] == ['3500000012']
+    assert result['total_pages'] == 1
+
+
+def test_query_files_fills_counts_and_rating(client):
+    items_by_id = raw_items()
+    result = run(client, client.query_files(fake_steam_api.APP_ID, 'top_rated', '', 1))
+    for item in result['items']:
+        raw = items_by_id[item['id']]
+        votes = raw['vote_data']['votes_up'] + raw['vote_data']['votes_down']
+        assert item['rating'] == round(raw['vote_data']['score'] * 5, 1)
+        assert item['rating_count'] == votes
+        assert item['subscriptions'] == raw['subscriptions']
+        assert item['favorites'] == raw['favorited']
+        assert item['author_id'] == raw['creator']
+    ratings = [item['rating'] for item in result['items']]
+    assert ratings == sorted(ratings, reverse=True)
+
+
+def test_get_published_file_details_batches(client, monkeypatch):
+    posts = []
+    request = client._request
+
+    async def counting_request(method, url, **kwargs):
+        if method == "POST":
+            posts.append(kwargs['data']['itemcount'])
+        return await request(method, url, **kwargs)
+
+    monkeypatch.setattr(client, "_request", counting_request)
+    item_ids = [str(3500000000 + index) for index in range(230)] + ['1', '3500000005']
+    details_by_id = run(client, client.get_published_file_details(item_ids))
+    # 去重后231个ID，按100个一批
+    assert sorted(posts) == [31, 100, 100]
+    # 不存在的物品（result为9）不包含在结果中
+    assert '1' not in details_by_id
+    assert len(details_by_id) == 230
+
+
+def test_sync_get_published_file_details_skips_missing(services, api_url):
+    steam_web_api = services[0]
+    web_api = steam_web_api.SteamWebApiClient(base_url=api_url, api_key=fake_steam_api.FAKE_API_KEY)
+    details_by_id = web_api.get_published_file_details(['3500000001', '3500000002', '42'])
+    assert sorted(details_by_id) == ['3500000001', '3500000002']
+
+    item = steam_web_api.SteamWebApiClient.to_item(details_by_id['3500000001'])
+    raw = raw_items()['3500000001']
+    assert item['subscriptions'] == raw['subscriptions']
+    assert item['favorites'] == raw['favorited']
+    assert item['author'] == steam_web_api.UNKNOWN_AUTHOR
+
+
+def test_resolve_author_names(services, client):
+    steam_web_api = services[0]
+    result = run(client, client.query_files(fake_steam_api.APP_ID, 'most_popular', '', 1))
+    assert all(item['author'] == steam_web_api.UNKNOWN_AUTHOR for item in result['items'])
+
+    run(client, client.resolve_author_names(result['items']))
+    for item in result['items']:
+        assert item['author'] == f"模拟作者 {item['author_id'][-6:]}"
+    # 已缓存的作者不再请求
+    assert client.service.web_api.player_summaries_params(result['items']) == []
+
+
+def test_player_summaries_params_batches(services):
+    steam_web_api = services[0]
+    web_api = steam_web_api.SteamWebApiClient(base_url="http://127.0.0.1:1", api_key="key")
+    items = [{'author_id': str(76561198000000000 + index)} for index in range(230)]
+    items.append({'author_id': items[0]['author_id']})
+    batches = web_api.player_summaries_params(items)
+    assert [len(params['steamids'].split(',')) for params in batches] == [100, 100, 30]
+
+
+def test_get_workshop_items_uses_web_api(client):
+    result = run(client, client.get_workshop_items(fake_steam_api.APP_ID, 'last_updated', '', 2))
+    assert result['current_page'] == 2
+    assert len(result['items']) == 30
+    assert all(item['author'].startswith("模拟作者") for item in result['items'])
@@ -0,0 +1,132 @@
+"""
+创意工坊浏览页解析基准测试
+
+比较主程序 services/workshop_parsers.py 中各解析后端的耗时，并检查解析结果是否一致。
+
+用法:
+    # 不指定样本时使用生成的合成浏览页（fixtures/browse_synthetic.html，不存在时自动生成）
+    python bench_workshop_parsers.py -n 50
+    # 保存几个真实浏览页作为测试样本
+    python bench_workshop_parsers.py --fetch 3 --app-id 3167020
+    # 对保存的样本运行基准测试
+    python bench_workshop_parsers.py fixtures/browse_1.html fixtures/browse_2.html -n 50
+"""
+import argparse
+import importlib.util
+import os
+import statistics
+import time
+
+from http_session import create_session
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+SYNTHETIC_FIXTURE = os.path.join(FIXTURES_DIR, "browse_synthetic.html")
+PARSERS_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                            "app", "src", "services", "workshop_parsers.py")
+
+
+def load_parsers():
+    """直接按文件路径加载解析模块，避免导入主程序services包时依赖flet"""
+    spec = importlib.util.spec_from_file_location("workshop_parsers", PARSERS_FILE)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def build_synthetic_page(item_count=30, last_page=57, app_id="3167020"):
+    """
+    生成与创意工坊浏览页结构相同的合成页面
+
+    物品节点的结构与真实页面一致，并在前后加入脚本、导航链接和页脚等无关标记，
+    使解析器需要跳过的内容与真实页面相近。内容固定，便于重复测试和比较结果。
+    """
+    parts = ['<html><head><title>x</title>', '<script>var a=1;</script>' * 50, '</head><body>',
+             '<div class="nav">', '<a href="/x">link</a>' * 300, '</div>',
+             '<div class="workshopBrowseItems">']
+    for index in range(item_count):
+        item_id = 3500000000 + index
+        parts.append(f"""<div class="workshopItem">
+  <a href="https://steamcommunity.com/sharedfiles/filedetails/?id={item_id}&searchtext=" class="ugc" data-publishedfileid="{item_id}">
+    <div class="workshopItemPreviewHolder"><img class="workshopItemPreviewImage aspectratio_square" src="https://images.steamusercontent.com/ugc/{index}/?imw=200" alt=""></div>
+  </a>
+  <a href="https://steamcommunity.com/sharedfiles/filedetails/?id={item_id}" class="item_link"><div class="workshopItemTitle ellipsis">Mod &amp; 模组 {index} <b>bold</b></div></a>
+  <div class="workshopItemAuthorName ellipsis">by&nbsp;<a class="workshop_author_link" href="https://steamcommunity.com/id/author{index}/myworkshopfiles/?appid={app_id}">Author {index}</a></div>
+</div>""")
+    parts.append('</div><div class="workshopBrowsePagingWithBG"><div class="workshopBrowsePagingControls">')
+    for page in (2, 3, 4, last_page):
+        parts.append(f'<a class="pagelink" href="https://steamcommunity.com/workshop/browse/'
+                     f'?appid={app_id}&browsesort=x&p={page}">{page}</a>')
+    parts.extend(['</div></div><div class="footer">', '<p>footer text</p>' * 500, '</div></body></html>'])
+    return ''.join(parts)
+
+
+def ensure_synthetic_fixture():
+    """合成样本不存在时生成并保存"""
+    if not os.path.exists(SYNTHETIC_FIXTURE):
+        os.makedirs(FIXTURES_DIR, exist_ok=True)
+        with open(SYNTHETIC_FIXTURE, 'w', encoding='utf-8') as f:
+            f.write(build_synthetic_page())
+        print(f"已生成合成样本 {SYNTHETIC_FIXTURE}")
+    return SYNTHETIC_FIXTURE
+
+
+def fetch_fixtures(app_id, pages):
+    """下载浏览页保存为测试样本"""
+    os.makedirs(FIXTURES_DIR, exist_ok=True)
+    session = create_session()
+    headers = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+    }
+    paths = []
+    for page in range(1, pages + 1):
+        url = (f"https://steamcommunity.com/workshop/browse/?appid={app_id}&section=readytouseitems"
+               f"&actualsort=totaluniquesubscribers&p={page}&browsesort=totaluniquesubscribers")
+        response = session.get(url, headers=headers, timeout=15)
+        response.raise_for_status()
+        path = os.path.join(FIXTURES_DIR, f"browse_{page}.html")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(response.text)
+        print(f"已保存 {path} ({len(response.text)} 字符)")
+        paths.append(path)
+    return paths
+
+
+def run_benchmark(paths, rounds):
+    """对每个样本运行所有可用的解析后端"""
+    parsers = load_parsers().PARSERS
+    print(f"可用后端: {', '.join(parsers)}")
+
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            html = f.read()
+        print(f"\n{os.path.basename(path)} ({len(html)} 字符)")
+
+        baseline = None
+        for name, parser in parsers.items():
+            timings = []
+            for _ in range(rounds):
+                start_time = time.perf_counter()
+                result = parser(html)
+                timings.append((time.perf_counter() - start_time) * 1000)
+
+            if baseline is None:
+                baseline = result
+            consistent = "一致" if result == baseline else "不一致"
+            print(f"  {name:<12} 中位数 {statistics.median(timings):8.2f} ms  "
+                  f"最小 {min(timings):8.2f} ms  物品 {len(result[0]):3d}  页数 {result[1]}  结果{consistent}")
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="创意工坊浏览页解析基准测试")
+    arg_parser.add_argument("fixtures", nargs="*", help="保存的浏览页HTML文件，不指定时使用合成样本")
+    arg_parser.add_argument("-n", "--rounds", type=int, default=20, help="每个后端的重复次数")
+    arg_parser.add_argument("--fetch", type=int, default=0, help="先下载指定数量的浏览页作为样本")
+    arg_parser.add_argument("--app-id", default="3167020", help="下载样本时使用的游戏ID")
+    args = arg_parser.parse_args()
+
+    fixture_paths = list(args.fixtures)
+    if args.fetch:
+        fixture_paths.extend(fetch_fixtures(args.app_id, args.fetch))
+    if not fixture_paths:
+        fixture_paths.append(ensure_synthetic_fixture())
+    run_benchmark(fixture_paths, args.rounds)
@@ -0,0 +1,178 @@
+"""
+本地模拟的Steam Web API服务器
+
+实现主程序用到的三个接口，返回按固定随机种子生成的创意工坊物品和作者：
+    GET  /IPublishedFileService/QueryFiles/v1/
+    POST /ISteamRemoteStorage/GetPublishedFileDetails/v1/
+    GET  /ISteamUser/GetPlayerSummaries/v2/
+
+用法:
+    python fake_steam_api.py --port 8765 --items 500
+然后在主程序的 app_config.json 中设置:
+    "steam_api_base_url": "http://127.0.0.1:8765",
+    "steam_web_api_key": "fake-key"
+"""
+import argparse
+import json
+import random
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+APP_ID = "3167020"
+FAKE_API_KEY = "fake-key"
+
+# EPublishedFileQueryType -> 排序字段
+SORT_FIELDS = {
+    0: lambda item: item['vote_data']['score'],
+    1: lambda item: item['time_created'],
+    9: lambda item: item['lifetime_subscriptions'],
+    21: lambda item: item['time_updated'],
+}
+
+
+def generate_items(count, seed=3167020):
+    """生成模拟的创意工坊物品"""
+    rng = random.Random(seed)
+    items = []
+    for index in range(count):
+        item_id = str(3500000000 + index)
+        votes_up = rng.randint(0, 5000)
+        votes_down = rng.randint(0, 500)
+        time_created = 1730000000 + rng.randint(0, 30000000)
+        subscriptions = rng.randint(0, 200000)
+        items.append({
+            'result': 1,
+            'publishedfileid': item_id,
+            'creator': str(76561198000000000 + rng.randint(0, 999999)),
+            'creator_app_id': int(APP_ID),
+            'consumer_app_id': int(APP_ID),
+            'title': f"模拟模组 {index} Mock Mod",
+            'short_description': f"第 {index} 个模拟模组的简介",
+            'file_description': f"第 {index} 个模拟模组的完整描述",
+            'preview_url': f"https://example.invalid/previews/{item_id}.png",
+            'time_created': time_created,
+            'time_updated': time_created + rng.randint(0, 5000000),
+            'subscriptions': subscriptions,
+            'lifetime_subscriptions': subscriptions + rng.randint(0, 50000),
+            'favorited': rng.randint(0, 20000),
+            'views': rng.randint(0, 1000000),
+            'vote_data': {
+                'score': round(votes_up / max(1, votes_up + votes_down), 4),
+                'votes_up': votes_up,
+                'votes_down': votes_down,
+            },
+        })
+    return items
+
+
+class FakeSteamApiHandler(BaseHTTPRequestHandler):
+    """处理模拟接口请求"""
+
+    items = []
+    items_by_id = {}
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        handlers = {
+            '/IPublishedFileService/QueryFiles/v1': self._query_files,
+            '/ISteamUser/GetPlayerSummaries/v2': self._player_summaries,
+        }
+        handler = handlers.get(parsed.path.rstrip('/'))
+        if handler is None:
+            self._send_json(404, {'error': 'not found'})
+            return
+
+        query = {key: values[-1] for key, values in parse_qs(parsed.query).items()}
+        if query.get('key') != FAKE_API_KEY:
+            # 与真实接口一致：缺少或错误的密钥返回403
+            self._send_json(403, {'error': 'invalid key'})
+            return
+        handler(query)
+
+    def _player_summaries(self, query):
+        """按SteamID返回作者昵称，最多100个"""
+        steam_ids = [steam_id for steam_id in query.get('steamids', '').split(',') if steam_id][:100]
+        players = [{'steamid': steam_id, 'personaname': f"模拟作者 {steam_id[-6:]}"} for steam_id in steam_ids]
+        self._send_json(200, {'response': {'players': players}})
+
+    def _query_files(self, query):
+
+        results = [item for item in self.items if str(item['consumer_app_id']) == query.get('appid', APP_ID)]
+        search_text = query.get('search_text', '').lower()
+        if search_text:
+            results = [item for item in results if search_text in item['title'].lower()]
+        sort_field = SORT_FIELDS.get(int(query.get('query_type', 9)), SORT_FIELDS[9])
+        results = sorted(results, key=sort_field, reverse=True)
+
+        page = max(1, int(query.get('page', 1)))
+        per_page = max(1, min(100, int(query.get('numperpage', 30))))
+        page_items = results[(page - 1) * per_page:page * per_page]
+        if query.get('return_vote_data') != 'true':
+            page_items = [{key: value for key, value in item.items() if key != 'vote_data'} for item in page_items]
+
+        self._send_json(200, {'response': {'total': len(results), 'publishedfiledetails': page_items}})
+
+    def do_POST(self):
+        parsed = urlparse(self.path)
+        if parsed.path.rstrip('/') != '/ISteamRemoteStorage/GetPublishedFileDetails/v1':
+            self._send_json(404, {'error': 'not found'})
+            return
+
+        length = int(self.headers.get('Content-Length', 0))
+        form = {key: values[-1] for key, values in parse_qs(self.rfile.read(length).decode('utf-8')).items()}
+        item_count = int(form.get('itemcount', 0))
+
+        details = []
+        for index in range(item_count):
+            item_id = form.get(f'publishedfileids[{index}]', '')
+            item = self.items_by_id.get(item_id)
+            if item is None:
+                # 与真实接口一致：不存在的物品result为9
+                details.append({'publishedfileid': item_id, 'result': 9})
+            else:
+                details.append({key: value for key, value in item.items() if key != 'vote_data'})
+
+        self._send_json(200, {'response': {'result': 1, 'resultcount': len(details), 'publishedfiledetails': details}})
+
+    def log_message(self, format, *args):
+        print(f"[fake-steam-api] {self.address_string()} {format % args}")
+
+
+def start_fake_server(port=0, item_count=200):
+    """
+    在后台线程启动模拟服务器
+
+    Returns:
+        tuple: (服务器实例, API地址)，调用 server.shutdown() 停止
+    """
+    items = generate_items(item_count)
+    handler = type('Handler', (FakeSteamApiHandler,), {
+        'items': items,
+        'items_by_id': {item['publishedfileid']: item for item in items},
+    })
+    server = ThreadingHTTPServer(('127.0.0.1', port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="本地模拟的Steam Web API服务器")
+    arg_parser.add_argument("--port", type=int, default=8765, help="监听端口")
+    arg_parser.add_argument("--items", type=int, default=200, help="模拟物品数量")
+    args = arg_parser.parse_args()
+
+    fake_server, base_url = start_fake_server(args.port, args.items)
+    print(f"模拟Steam Web API已启动: {base_url}（API密钥: {FAKE_API_KEY}），按Ctrl+C停止")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        fake_server.shutdown()
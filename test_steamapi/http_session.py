@@ -0,0 +1,25 @@
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def create_session(pool_maxsize=16, retries=3, backoff_factor=0.5):
+    """
+    创建带连接池和重试的HTTP会话
+
+    与主程序 services/http_session.py 的配置一致：复用同一主机的连接（keep-alive），
+    每个主机最多 pool_maxsize 个连接，连接错误、429和5xx响应按指数退避重试。
+    """
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_maxsize=pool_maxsize, max_retries=retry, pool_block=True)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({'Accept-Encoding': 'gzip, deflate'})
+    return session
@@ -2,6 +2,11 @@ import requests
 from bs4 import BeautifulSoup
 import re
 
+from http_session import create_session
+
+# 所有请求共用一个会话，复用连接
+session = create_session()
+
 def get_steam_workshop_dependencies_final(item_id):
     """
     最终版本的Steam创意工坊依赖项获取函数
@@ -14,7 +19,7 @@ def get_steam_workshop_dependencies_final(item_id):
     }
     
     try:
-        response = requests.get(url, headers=headers, timeout=15)
+        response = session.get(url, headers=headers, timeout=15)
         response.raise_for_status()
     except requests.RequestException as e:
         print(f"获取页面时出错: {e}")
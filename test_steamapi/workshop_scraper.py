@@ -3,6 +3,8 @@ from bs4 import BeautifulSoup
 import re
 from typing import List, Dict, Optional
 
+from http_session import create_session
+
 
 class SteamWorkshopScraper:
     """
@@ -14,6 +16,8 @@ class SteamWorkshopScraper:
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
+        # 复用连接的HTTP会话
+        self.session = create_session()
         # 排序参数映射
         self.sort_params = {
             'most_popular': 'totaluniquesubscribers',  # 最多订阅
@@ -59,7 +63,7 @@ class SteamWorkshopScraper:
         print(f"排序方式: {sort_by}")
 
         try:
-            response = requests.get(url, headers=self.headers, timeout=15)
+            response = self.session.get(url, headers=self.headers, timeout=15)
             response.raise_for_status()
         except requests.RequestException as e:
             print(f"获取页面时出错: {e}")